@@ -146,7 +146,9 @@ def extract_embedding_on_rack(audio_path: str) -> Optional[List[float]]:
             logger.error(f"  Error: {response['error']}")
             return None
 
-        embedding = response.get("embedding")
+        # Newer speaker_recognition.py sends base64 float32 ("embedding_b64")
+        from speaker_recognition import decode_embedding
+        embedding = decode_embedding(response).tolist()
 
         # Clean up remote file
         cleanup_cmd = ["ssh", Config.RACK_SSH_HOST, f"rm -f {remote_path}"]
@@ -231,9 +233,9 @@ def validate_database(database: Dict[str, List[List[float]]]) -> Dict[str, Any]:
     import numpy as np
 
     def cosine_similarity(e1, e2):
-        e1 = np.array(e1)
-        e2 = np.array(e2)
-        return np.dot(e1, e2) / (np.linalg.norm(e1) * np.linalg.norm(e2) + 1e-8)
+        e1 = np.asarray(e1)
+        e2 = np.asarray(e2)
+        return np.dot(e1, e2) / (np.sqrt(np.vdot(e1, e1) * np.vdot(e2, e2)) + 1e-8)
 
     stats = {
         "presenters": len(database),
@@ -404,6 +406,10 @@ def main():
     with open(output_path, "w") as f:
         json.dump(database, f, indent=2)
 
+    # Stacked float32 copy that speaker_recognition.py loads in preference
+    from speaker_recognition import save_database_npz
+    save_database_npz(database, str(output_path.with_suffix(".npz")), source_path=str(output_path))
+
     logger.info(f"\n✓ Database saved to: {output_path}")
 
     # Save metadata if requested
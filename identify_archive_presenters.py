@@ -23,7 +23,7 @@ from typing import Dict, List, Optional, Tuple
 
 # Import from main script
 sys.path.insert(0, '/home/pi')
-from kiwi_recorder import Config
+from kiwi_recorder import Config, SIDECAR_FORECAST_MARKER, SIDECAR_PRESENTER_SECTION
 
 
 logging.basicConfig(
@@ -205,30 +205,28 @@ def update_sidecar_with_voiceprint(txt_path: str, match_result: Dict) -> bool:
         True if updated successfully
     """
     try:
-        if not os.path.exists(txt_path):
+        # Read existing content (a missing sidecar simply isn't updated)
+        try:
+            with open(txt_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
             return False
 
-        # Read existing content
-        with open(txt_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         # Build presenter section
-        presenter_section = "\n" + "="*70 + "\n"
-        presenter_section += "PRESENTER\n"
-        presenter_section += "="*70 + "\n\n"
-
         if match_result.get('matches') and len(match_result['matches']) > 0:
             best_match = match_result['matches'][0]
-            presenter_section += f"Presenter: {best_match['name']}\n"
-            presenter_section += f"Confidence: {best_match['similarity']:.2f}\n"
-            presenter_section += f"Match type: voiceprint\n"
-            presenter_section += f"Detection method: Voiceprint matching from archive\n"
+            section_body = (
+                f"Presenter: {best_match['name']}\n"
+                f"Confidence: {best_match['similarity']:.2f}\n"
+                "Match type: voiceprint\n"
+                "Detection method: Voiceprint matching from archive"
+            )
         else:
-            presenter_section += "Presenter: Not detected\n"
-            presenter_section += "Status: voiceprint_no_match\n"
+            section_body = "Presenter: Not detected\nStatus: voiceprint_no_match"
+        presenter_section = SIDECAR_PRESENTER_SECTION.format(body=section_body)
 
         # Insert presenter section before shipping forecast or at end
-        forecast_marker = "="*70 + "\nSHIPPING FORECAST"
+        forecast_marker = SIDECAR_FORECAST_MARKER
         if forecast_marker in content:
             content = content.replace(forecast_marker, presenter_section + "\n" + forecast_marker)
         else:
@@ -16,32 +16,56 @@ Features:
 """
 
 import argparse
+import asyncio
 import email.utils
+import functools
+import heapq
 import html
+import importlib.util
+import io
 import json
 import logging
+import mmap
 import os
 import pathlib
 import random
 import re
 import shutil
 import socket
-import statistics
 import subprocess
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Tuple, Dict, List, Any
+from types import MappingProxyType
+from typing import Optional, Tuple, Dict, List, Any, Mapping, TextIO
 from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import wave
+from scipy import fft as sp_fft
 from scipy import signal
 
+try:
+    import orjson  # Optional: faster JSON (de)serialization for scan files
+except ImportError:
+    orjson = None
+
+try:
+    import soundfile as sf  # Optional: decode WAVs straight into NumPy arrays
+except ImportError:
+    sf = None
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process  # Optional: fast presenter fuzzy matching
+except ImportError:
+    fuzz = fuzz_process = None
+
 
 # ============================================================================
 # CONFIGURATION
@@ -58,6 +82,7 @@ class Config:
     SCAN_POINTER = str(HOME / "kiwi_scans" / "latest_scan_198.json")
     LOG_FILE = str(HOME / "Shipping_Forecast_SDR_Recordings.log")
     FEED_PATH = HOME / "share" / "198k" / "feed.xml"
+    FEED_ITEM_CACHE = HOME / "share" / "198k" / "feed_items.cache.json"
     ART_NAME = "artwork.jpg"
     ANTHEM_TEMPLATE = str(HOME / "share" / "198k" / "anthem_template.wav")
 
@@ -68,6 +93,10 @@ class Config:
     PARALLEL_RECORDINGS = 2  # Number of simultaneous recordings (redundancy for reliability)
     MIN_VALID_SIZE_MB = 11  # Minimum file size in MB for valid recording (~50% of expected 21 MB)
 
+    # Anthem detection: coarse search on audio decimated by this factor, then
+    # refine the peak at full rate
+    ANTHEM_DECIMATION = 8
+
     # Excluded receivers (chronically unreliable)
     EXCLUDED_HOSTS = [
         "websdr.uk",  # Chronic "Too busy" errors during broadcast times
@@ -83,6 +112,7 @@ class Config:
 
     # Network timeouts
     CONNECT_TIMEOUT = 7
+    REACHABILITY_TIMEOUT = 1.0  # TCP pre-check before spending PROBE_SEC on a host
     DISCOVERY_TIMEOUT = 8
     RECORDING_TIMEOUT_MARGIN = 60  # Extra seconds beyond duration
 
@@ -172,31 +202,84 @@ class Config:
 
 # Compiled regex patterns for RSSI parsing
 HTTP_URL_RE = re.compile(r"https?://([A-Za-z0-9\-\.\:]+)", re.I)
-RSSI_NUM_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*dB(?:FS)?", re.I)
-RSSI_RSSI_RE = re.compile(r"RSSI[=:]\s*(-?\d+(?:\.\d+)?)", re.I)
+# Listing filters: one alternation scan instead of an any() loop per key
+COUNTRY_KEYS_RE = re.compile("|".join(map(re.escape, Config.COUNTRY_KEYS)))
+HOST_HINTS_RE = re.compile("|".join(map(re.escape, Config.HOST_HINTS)))
+# One pass finds both "<num> dB[FS]" values and "RSSI=<num>" values. The RSSI
+# branch captures its number in a lookahead without consuming it, so a
+# following "dB" reading is still matched by the first branch.
+RSSI_VALUE_RE = re.compile(
+    r"(?P<db>-?\d+(?:\.\d+)?)\s*dB(?:FS)?|RSSI[=:]\s*(?=(?P<rssi>-?\d+(?:\.\d+)?))",
+    re.I,
+)
 FILENAME_PATTERN = re.compile(
     r"ShippingFCST-(\d{6})_(AM|PM)_(\d{6})UTC--(.+?)--avg-(\d+)(?:_processed)?\.[^\.]+$",
     re.IGNORECASE
 )
 
+# Section separator used in sidecar (.txt) files
+SIDECAR_SEP = "=" * 70
+SIDECAR_FORECAST_MARKER = f"{SIDECAR_SEP}\nSHIPPING FORECAST"
+SIDECAR_PRESENTER_SECTION = f"\n{SIDECAR_SEP}\nPRESENTER\n{SIDECAR_SEP}\n\n{{body}}\n"
+
+# Sidecars at least this large are decoded straight from an mmap (page overhead dominates below)
+SIDECAR_MMAP_MIN_BYTES = 4096
+
+# Frames per wave.readframes() call when decoding WAVs without soundfile
+WAV_READ_BLOCK_FRAMES = 1 << 16
+
+# Sidecar (.txt) field patterns used by feed generation and ID3 tagging
+SIDECAR_PRESENTER_RE = re.compile(r"^Presenter:\s*(.+)$", re.MULTILINE)
+SIDECAR_UNKNOWN_PRESENTER_RE = re.compile(r"^Unknown presenter:\s*(.+)$", re.MULTILINE)
+# Single-line "Key: value" fields the feed description needs, matched in one pass
+SIDECAR_FIELDS_RE = re.compile(
+    r"^(Presenter|Confidence|Match type|Host|RSSI|UTC)\s*:\s*(.+)$", re.MULTILINE
+)
+FORECAST_SYNOPSIS_RE = re.compile(r"<h2>The general synopsis at \d+</h2>\s*<p>(.+?)</p>")
+FORECAST_GALE_WARNING_RE = re.compile(r'<p class="warning">\s*There are.*?in\s+(.+?)\s*</p>', re.DOTALL)
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+HTML_BODY_OPEN_RE = re.compile(r"<body\b[^>]*>", re.I)
+
+# Broadcast schedule timezone (resolved once instead of per call)
+LONDON_TZ = ZoneInfo("Europe/London")
+
+# Shared HTTP session: the public listings (both on kiwisdr.com) and the Met
+# Office fetch reuse pooled keep-alive connections instead of a fresh TCP+TLS
+# handshake per request
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({"User-Agent": "KiwiSDR-Recorder/1.0"})
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 # Met Office Shipping Forecast URL
 METOFFICE_FORECAST_URL = "https://weather.metoffice.gov.uk/specialist-forecasts/coast-and-sea/print/shipping-forecast"
 
-# Presenter detection patterns
+# Presenter detection patterns. Case-sensitive: names must be capitalized
+# ([A-Z][a-z]+, as Whisper writes them), only the lead-in words allow either case
 PRESENTER_NAME_PATTERNS = [
-    re.compile(r"\b(?:This is|This has been)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)", re.IGNORECASE),
-    re.compile(r"\b(?:I'm|I am)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)", re.IGNORECASE),
-    re.compile(r"\b(?:It's|It is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+here", re.IGNORECASE),
-    re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:for|on|from)\s+(?:BBC|Radio)", re.IGNORECASE),
-    re.compile(r"\bwith\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*[.,]", re.IGNORECASE),
-    re.compile(r"\b(?:from me|for me)[,.]?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)", re.IGNORECASE),
-    re.compile(r"\bmyself[,.]?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)", re.IGNORECASE),
+    re.compile(r"\b(?:[Tt]his is|[Tt]his has been)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)"),
+    re.compile(r"\b(?:I'm|I am)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)"),
+    re.compile(r"\b(?:[Ii]t's|[Ii]t is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+here"),
+    re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:for|on|from)\s+(?:BBC|Radio)"),
+    re.compile(r"\b[Ww]ith\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*[.,]"),
+    re.compile(r"\b(?:[Ff]rom me|[Ff]or me)[,.]?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)"),
+    re.compile(r"\b[Mm]yself[,.]?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)"),
 ]
 
-PRESENTER_FALSE_POSITIVES = {
+# Sign-offs come at the end of the transcribed segment, so only the last this
+# many characters are scanned. The 45s segment's transcripts (~650-900 chars)
+# fit whole; a 512-char window already changed a few detections in the archive
+PRESENTER_SCAN_WINDOW = 1024
+
+# The patterns above as one alternation (a single capture group each), so a
+# transcript is scanned once; match.lastindex tells which pattern matched
+PRESENTER_NAME_RE = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in PRESENTER_NAME_PATTERNS)
+)
+
+PRESENTER_FALSE_POSITIVES = frozenset({
     "the", "shipping", "forecast", "weather", "radio", "bbc",
     "good", "night", "morning", "evening", "and", "now", "that"
-}
+})
 
 
 def setup_logging(log_file: Optional[str] = None) -> logging.Logger:
@@ -222,11 +305,22 @@ def setup_logging(log_file: Optional[str] = None) -> logging.Logger:
     return logger
 
 
+def collect_rssi_values(text: str, db_vals: List[float], rssi_vals: List[float]) -> None:
+    """Append "dB" readings and bare RSSI= readings found in text to their lists"""
+    for m in RSSI_VALUE_RE.finditer(text):
+        if m.group("db") is not None:
+            db_vals.append(float(m.group("db")))
+        else:
+            rssi_vals.append(float(m.group("rssi")))
+
+
 def parse_rssi_output(output: str) -> Optional[List[float]]:
     """Extract RSSI values from kiwirecorder output"""
-    vals = [float(x) for x in RSSI_NUM_RE.findall(output)]
-    if not vals:
-        vals = [float(x) for x in RSSI_RSSI_RE.findall(output)]
+    db_vals: List[float] = []
+    rssi_vals: List[float] = []
+    collect_rssi_values(output, db_vals, rssi_vals)
+    # "dB" readings take precedence; bare RSSI= values are the fallback
+    vals = db_vals or rssi_vals
     return vals if vals else None
 
 
@@ -234,16 +328,79 @@ def parse_rssi_output(output: str) -> Optional[List[float]]:
 # PRESENTER DETECTION
 # ============================================================================
 
+@functools.lru_cache(maxsize=2)
+def read_presenters_file(path: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """
+    Parse the presenters database. Cached on (path, mtime_ns) so repeated
+    detections (e.g. an archive sweep) share one list and its match index;
+    auto-adding a presenter rewrites the file and so invalidates it.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return data.get("presenters", [])
+
+
 def load_presenters() -> List[Dict[str, Any]]:
     """Load known presenters database from JSON file."""
     try:
-        if os.path.exists(Config.PRESENTERS_FILE):
-            with open(Config.PRESENTERS_FILE) as f:
-                data = json.load(f)
-                return data.get("presenters", [])
+        mtime_ns = os.stat(Config.PRESENTERS_FILE).st_mtime_ns
+        return read_presenters_file(Config.PRESENTERS_FILE, mtime_ns)
     except Exception:
-        pass
-    return []
+        return []
+
+
+def build_presenter_index(
+    known_presenters: List[Dict[str, Any]]
+) -> Tuple[Dict[str, Tuple[str, str]], List[str], List[Tuple[str, str]], List[Any], np.ndarray]:
+    """
+    Lowercase every presenter name and variation once for matching.
+
+    Returns:
+        Tuple of (exact, choices, targets, matchers, lengths): exact maps a lowercased
+        name or variation to (canonical name, "exact"|"variation"), first
+        occurrence winning; choices[i] is a lowercased string for fuzzy
+        matching and targets[i] its (canonical name, "fuzzy"|"fuzzy_variation").
+        Each full name precedes its variations so ties keep the full-name type.
+        Without rapidfuzz, matchers[i] is a SequenceMatcher with choices[i] as
+        seq2, so difflib's index of it is built once rather than per query,
+        and lengths[i] is len(choices[i]) for prefiltering them as an array.
+    """
+    exact: Dict[str, Tuple[str, str]] = {}
+    choices: List[str] = []
+    targets: List[Tuple[str, str]] = []
+    for presenter in known_presenters:
+        canonical = presenter["name"]
+        name_lower = canonical.lower()
+        exact.setdefault(name_lower, (canonical, "exact"))
+        choices.append(name_lower)
+        targets.append((canonical, "fuzzy"))
+        for variation in presenter.get("variations", []):
+            variation_lower = variation.lower()
+            exact.setdefault(variation_lower, (canonical, "variation"))
+            choices.append(variation_lower)
+            targets.append((canonical, "fuzzy_variation"))
+
+    matchers = []
+    if fuzz_process is None:
+        from difflib import SequenceMatcher
+        matchers = [SequenceMatcher(None, "", choice) for choice in choices]
+    lengths = np.fromiter(map(len, choices), dtype=np.int64, count=len(choices))
+
+    return exact, choices, targets, matchers, lengths
+
+
+# (presenters list, its index) for the list most recently matched against;
+# holding the list keeps its id from being reused
+_PRESENTER_INDEX: Optional[Tuple[List[Dict[str, Any]], Tuple]] = None
+
+
+def presenter_index(known_presenters: List[Dict[str, Any]]) -> Tuple:
+    """build_presenter_index, reused while the same (unmodified) list is passed in."""
+    global _PRESENTER_INDEX
+    if _PRESENTER_INDEX is None or _PRESENTER_INDEX[0] is not known_presenters:
+        _PRESENTER_INDEX = (known_presenters, build_presenter_index(known_presenters))
+    return _PRESENTER_INDEX[1]
 
 
 def auto_add_presenter_to_database(
@@ -357,18 +514,38 @@ def auto_add_presenter_to_database(
         return False
 
 
-def extract_name_candidates(transcript: str) -> List[str]:
+def extract_name_candidates(
+    transcript: str,
+    window_size: Optional[int] = PRESENTER_SCAN_WINDOW
+) -> List[str]:
+    """
+    Extract potential presenter names from transcript using regex patterns.
+
+    Only the last window_size characters are scanned (None scans everything).
+    """
     # Normalize whitespace (Whisper sometimes adds extra spaces from line breaks)
     transcript = " ".join(transcript.split())
-    """Extract potential presenter names from transcript using regex patterns."""
+    if window_size is not None and len(transcript) > window_size:
+        transcript = transcript[-window_size:]
+
+    # Single pass over the transcript, then pattern order (as when each
+    # pattern was scanned in turn) so earlier patterns' names are tried first
+    found = sorted(
+        (m.lastindex, m.start(), m.group(m.lastindex))
+        for m in PRESENTER_NAME_RE.finditer(transcript)
+    )
+
     candidates = []
-    for pattern in PRESENTER_NAME_PATTERNS:
-        matches = pattern.findall(transcript)
-        for match in matches:
-            # Filter out false positives
-            words = match.lower().split()
-            if not all(w in PRESENTER_FALSE_POSITIVES for w in words):
-                candidates.append(match)
+    for _, _, match in found:
+        # Filter out matches made only of false-positive words (stops at the
+        # first real word; single words skip the split)
+        lowered = match.lower()
+        if " " in lowered:
+            keep = any(w not in PRESENTER_FALSE_POSITIVES for w in lowered.split())
+        else:
+            keep = lowered not in PRESENTER_FALSE_POSITIVES
+        if keep:
+            candidates.append(match)
     return candidates
 
 
@@ -378,39 +555,42 @@ def fuzzy_match_presenter(
     threshold: float = 0.7
 ) -> Optional[Dict[str, Any]]:
     """Fuzzy match extracted name against known presenters database."""
-    from difflib import SequenceMatcher
-
     name_lower = name.lower().strip()
+    exact, choices, targets, matchers, lengths = presenter_index(known_presenters)
 
     # FIRST PASS: Check all exact matches and variations
-    for presenter in known_presenters:
-        # Check exact match on full name
-        if name_lower == presenter["name"].lower():
-            return {"name": presenter["name"], "confidence": 1.0, "match_type": "exact"}
-
-        # Check variations
-        for variation in presenter.get("variations", []):
-            if name_lower == variation.lower():
-                return {"name": presenter["name"], "confidence": 1.0, "match_type": "variation"}
+    hit = exact.get(name_lower)
+    if hit:
+        return {"name": hit[0], "confidence": 1.0, "match_type": hit[1]}
 
     # SECOND PASS: Check fuzzy matches (only if no exact match found)
+    if fuzz_process is not None:
+        best = fuzz_process.extractOne(name_lower, choices, scorer=fuzz.ratio, score_cutoff=threshold * 100)
+        if best is None:
+            return None
+        _, score, idx = best
+        return {"name": targets[idx][0], "confidence": score / 100, "match_type": targets[idx][1]}
+
     best_match = None
     best_ratio = 0.0
-    
-    for presenter in known_presenters:
-        # Fuzzy match on full name
-        ratio = SequenceMatcher(None, name_lower, presenter["name"].lower()).ratio()
+
+    # ratio can't exceed 2*min(len)/(sum of lens) (difflib's real_quick_ratio),
+    # so rule out choices on length alone in one pass over the array
+    n = len(name_lower)
+    in_reach = np.flatnonzero(2.0 * np.minimum(lengths, n) / (lengths + n) >= threshold)
+
+    for i in in_reach:
+        matcher = matchers[i]
+        canonical, fuzzy_type = targets[i]
+        matcher.set_seq1(name_lower)
+        # quick_ratio (shared characters) is a cheap upper bound on ratio
+        if matcher.quick_ratio() < threshold:
+            continue
+        ratio = matcher.ratio()
         if ratio >= threshold and ratio > best_ratio:
-            best_match = {"name": presenter["name"], "confidence": ratio, "match_type": "fuzzy"}
+            best_match = {"name": canonical, "confidence": ratio, "match_type": fuzzy_type}
             best_ratio = ratio
 
-        # Fuzzy match on variations
-        for variation in presenter.get("variations", []):
-            ratio = SequenceMatcher(None, name_lower, variation.lower()).ratio()
-            if ratio >= threshold and ratio > best_ratio:
-                best_match = {"name": presenter["name"], "confidence": ratio, "match_type": "fuzzy_variation"}
-                best_ratio = ratio
-    
     return best_match
 
     return None
@@ -708,6 +888,61 @@ def detect_presenter(
     return result
 
 
+def smeter_command(host: str, port: int, seconds: int) -> List[str]:
+    """Build the kiwirecorder command line for an S-meter probe"""
+    # kiwirecorder is a CLI (argparse, its own threads, sys.exit) with no
+    # importable S-meter API, so probes stay subprocesses; scan_hosts runs
+    # them concurrently so interpreter start-up overlaps across hosts
+    return [
+        "python3", Config.KIWI_REC_PATH,
+        "-s", host, "-p", str(port),
+        "-f", Config.FREQ_KHZ,
+        "--S-meter=1",
+        "--time-limit", str(seconds),
+        "--quiet"
+    ]
+
+
+async def probe_smeter_async(
+    host: str,
+    port: int,
+    seconds: int
+) -> Tuple[Optional[List[float]], Optional[str]]:
+    """
+    asyncio variant of probe_smeter for the initial scan, so one event loop
+    can supervise every kiwirecorder child instead of a thread per probe
+
+    Returns:
+        (values_list, error_string) - values if successful, error description if failed
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *smeter_command(host, port, seconds),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    except Exception as e:
+        return None, f"error: {e}"
+
+    try:
+        stdout, _ = await asyncio.wait_for(
+            proc.communicate(), timeout=seconds + Config.CONNECT_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None, "timeout"
+    except Exception as e:
+        return None, f"error: {e}"
+
+    vals = parse_rssi_output(stdout.decode("utf-8", errors="replace"))
+
+    if not vals:
+        return None, "no-RSSI"
+
+    return vals, None
+
+
 def probe_smeter(
     host: str,
     port: int,
@@ -720,36 +955,56 @@ def probe_smeter(
     Returns:
         (values_list, error_string) - values if successful, error description if failed
     """
-    cmd = [
-        "python3", Config.KIWI_REC_PATH,
-        "-s", host, "-p", str(port),
-        "-f", Config.FREQ_KHZ,
-        "--S-meter=1",
-        "--time-limit", str(seconds),
-        "--quiet"
-    ]
+    cmd = smeter_command(host, port, seconds)
 
+    # Parse output line by line as it arrives instead of buffering the whole
+    # run in memory (stderr is merged, as the readings can land on either)
     try:
-        proc = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=seconds + Config.CONNECT_TIMEOUT
+            bufsize=1
         )
-    except subprocess.TimeoutExpired:
-        return None, "timeout"
     except Exception as e:
         return None, f"error: {e}"
 
-    output = (proc.stdout or "") + (proc.stderr or "")
-    vals = parse_rssi_output(output)
+    # Popen has no timeout of its own; kill the child if it overruns
+    timed_out = threading.Event()
+
+    def _kill_on_timeout() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(seconds + Config.CONNECT_TIMEOUT, _kill_on_timeout)
+    timer.start()
+
+    db_vals: List[float] = []
+    rssi_vals: List[float] = []
+    try:
+        with proc.stdout:
+            for line in proc.stdout:
+                collect_rssi_values(line, db_vals, rssi_vals)
+        proc.wait()
+    except Exception as e:
+        proc.kill()
+        proc.wait()
+        return None, f"error: {e}"
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        return None, "timeout"
 
+    vals = db_vals or rssi_vals
     if not vals:
         return None, "no-RSSI"
 
     return vals, None
 
 
+@functools.lru_cache(maxsize=1024)
 def hostname_short(host: str) -> str:
     """Shorten hostname: g8gporx.proxy.kiwisdr.com -> g8gporx.proxy.kiwisdr"""
     h = host.split(":")[0]
@@ -825,22 +1080,18 @@ def fetch_shipping_forecast(logger: logging.Logger) -> Optional[str]:
     """
     try:
         logger.info(f"Fetching shipping forecast from {METOFFICE_FORECAST_URL}")
-        response = requests.get(
-            METOFFICE_FORECAST_URL,
-            timeout=Config.DISCOVERY_TIMEOUT,
-            headers={"User-Agent": "KiwiSDR-Recorder/1.0"}
-        )
+        response = HTTP_SESSION.get(METOFFICE_FORECAST_URL, timeout=Config.DISCOVERY_TIMEOUT)
         response.raise_for_status()
 
-        # Extract the body content (everything between <body> and </body>)
+        # Extract the body content (everything between <body> and </body>).
+        # The opening tag is matched as a whole tag (not e.g. "<bodyfoo"), and
+        # the closing tag is searched from the end of the page, where it lives.
         content = response.text
-        body_start = content.find('<body')
-        body_end = content.find('</body>')
+        body_open = HTML_BODY_OPEN_RE.search(content)
+        body_end = content.rfind('</body>')
 
-        if body_start != -1 and body_end != -1:
-            # Find the end of the opening <body> tag
-            body_start = content.find('>', body_start) + 1
-            forecast_html = content[body_start:body_end].strip()
+        if body_open and body_end >= body_open.end():
+            forecast_html = content[body_open.end():body_end].strip()
             logger.info(f"Successfully fetched shipping forecast ({len(forecast_html)} chars)")
             return forecast_html
         else:
@@ -858,6 +1109,90 @@ def fetch_shipping_forecast(logger: logging.Logger) -> Optional[str]:
         return None
 
 
+def read_wav_samples(path: str, dtype: str = "float32") -> Tuple[np.ndarray, int]:
+    """
+    Read a mono 16-bit WAV into a NumPy array.
+
+    With soundfile installed, libsndfile decodes directly into the output
+    array; otherwise the wave module's frame bytes are converted. float32
+    samples are scaled to [-1.0, 1.0) by both paths.
+
+    Returns:
+        Tuple of (samples, sample_rate)
+    """
+    if sf is not None:
+        return sf.read(path, dtype=dtype, always_2d=False)
+
+    # Decode in blocks straight into a preallocated array, so a full-size
+    # bytes copy of the file is never held alongside the result
+    with wave.open(path, 'r') as wav:
+        rate = wav.getframerate()
+        total = wav.getnframes() * wav.getnchannels()
+        samples = np.empty(total, dtype=np.int16 if dtype == "int16" else np.float32)
+        pos = 0
+        while pos < total:
+            block = wav.readframes(WAV_READ_BLOCK_FRAMES)
+            if not block:
+                break
+            block_samples = np.frombuffer(block, dtype=np.int16)
+            samples[pos:pos + len(block_samples)] = block_samples
+            pos += len(block_samples)
+    samples = samples[:pos]
+
+    if dtype != "int16":
+        samples *= 1.0 / 32768
+    return samples, rate
+
+
+@functools.lru_cache(maxsize=4)
+def load_anthem_template(path: str, mtime: float, target_rate: int) -> Tuple[np.ndarray, int]:
+    """
+    Load the anthem template resampled to target_rate and normalized to zero
+    mean / unit variance. Cached on (path, mtime, target_rate) so repeated
+    detections skip the WAV parse, resample and normalization.
+
+    Returns:
+        Tuple of (normalized template, template's native sample rate)
+    """
+    template, template_rate = read_wav_samples(path)
+
+    # Resample template if sample rates don't match
+    if template_rate != target_rate:
+        # Calculate number of samples needed for target rate
+        num_samples = int(len(template) * target_rate / template_rate)
+        template = signal.resample(template, num_samples)
+
+    template_norm = (template - np.mean(template)) / np.std(template)
+    template_norm.setflags(write=False)  # shared across calls via the cache
+    return template_norm, template_rate
+
+
+@functools.lru_cache(maxsize=4)
+def anthem_template_spectrum(
+    path: str,
+    mtime: float,
+    target_rate: int,
+    decimation: int,
+    search_len: int
+) -> Tuple[np.ndarray, int, int]:
+    """
+    FFT of the (decimated, reversed) anthem template for correlating against a
+    search region of search_len samples. Recordings share a fixed length, so
+    batch reprocessing hits the cache and skips the template-side FFT.
+
+    Returns:
+        Tuple of (rfft spectrum, FFT length, decimated template length)
+    """
+    template_norm, _ = load_anthem_template(path, mtime, target_rate)
+    if decimation > 1:
+        template_norm = signal.decimate(template_norm, decimation, ftype='fir')
+    m = len(template_norm)
+    nfft = sp_fft.next_fast_len(search_len + m - 1, real=True)
+    spectrum = np.fft.rfft(template_norm[::-1], n=nfft)
+    spectrum.setflags(write=False)
+    return spectrum, nfft, m
+
+
 def detect_anthem_start(wav_path: str, logger: logging.Logger) -> Optional[Tuple[float, int]]:
     """
     Detect where the national anthem starts using cross-correlation with a template
@@ -872,29 +1207,21 @@ def detect_anthem_start(wav_path: str, logger: logging.Logger) -> Optional[Tuple
     """
     try:
         # Check if template exists
-        if not os.path.exists(Config.ANTHEM_TEMPLATE):
+        try:
+            template_mtime = os.path.getmtime(Config.ANTHEM_TEMPLATE)
+        except OSError:
             logger.warning(f"Anthem template not found: {Config.ANTHEM_TEMPLATE}")
             return None
 
-        # Load template
-        with wave.open(Config.ANTHEM_TEMPLATE, 'r') as wav:
-            frames = wav.readframes(wav.getnframes())
-            template_rate = wav.getframerate()
-            template = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
-
         # Load recording
-        with wave.open(wav_path, 'r') as wav:
-            frames = wav.readframes(wav.getnframes())
-            rec_rate = wav.getframerate()
-            recording = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+        recording, rec_rate = read_wav_samples(wav_path)
 
-        # Resample template if sample rates don't match
+        # Load template (resampled to the recording's rate and normalized, cached)
+        template_norm, template_rate = load_anthem_template(
+            Config.ANTHEM_TEMPLATE, template_mtime, rec_rate
+        )
         if template_rate != rec_rate:
-            logger.info(f"Sample rate mismatch - resampling template from {template_rate} to {rec_rate} Hz")
-            # Calculate number of samples needed for target rate
-            num_samples = int(len(template) * rec_rate / template_rate)
-            template = signal.resample(template, num_samples)
-            template_rate = rec_rate
+            logger.info(f"Sample rate mismatch - resampled template from {template_rate} to {rec_rate} Hz")
 
         # Start search from 10 minutes
         start_search_time = 10 * 60
@@ -906,16 +1233,33 @@ def detect_anthem_start(wav_path: str, logger: logging.Logger) -> Optional[Tuple
 
         search_region = recording[start_sample:]
 
-        # Normalize both signals
-        template_norm = (template - np.mean(template)) / np.std(template)
+        # Normalize search region (template is normalized once when cached)
         search_norm = (search_region - np.mean(search_region)) / np.std(search_region)
 
-        # Compute cross-correlation
-        correlation = signal.correlate(search_norm, template_norm, mode='valid')
-
-        # Find peak
-        peak_idx = np.argmax(correlation)
-        peak_value = correlation[peak_idx]
+        # Coarse pass: cross-correlate decimated signals via FFT, which cuts
+        # FFT size and memory traffic by the decimation factor. The template's
+        # spectrum is cached, so only the search region is transformed here.
+        q = max(1, Config.ANTHEM_DECIMATION)
+        search_ds = signal.decimate(search_norm, q, ftype='fir') if q > 1 else search_norm
+        spectrum, nfft, m = anthem_template_spectrum(
+            Config.ANTHEM_TEMPLATE, template_mtime, rec_rate, q, len(search_ds)
+        )
+        if len(search_ds) < m:
+            logger.warning("Recording too short for anthem detection")
+            return None
+        # Valid-mode correlation == full convolution with the reversed template, trimmed
+        coarse = np.fft.irfft(np.fft.rfft(search_ds, n=nfft) * spectrum, n=nfft)[m - 1:len(search_ds)]
+        peak_idx = int(np.argmax(coarse)) * q
+        peak_value = coarse[peak_idx // q]
+
+        if q > 1:
+            # Fine pass: full-rate correlation in a small window around the coarse peak
+            lo = max(0, peak_idx - 2 * q)
+            hi = min(len(search_norm) - len(template_norm), peak_idx + 2 * q)
+            window = search_norm[lo:hi + len(template_norm)]
+            correlation = signal.correlate(window, template_norm, mode='valid')
+            peak_idx = lo + int(np.argmax(correlation))
+            peak_value = correlation[peak_idx - lo]
 
         # Convert to time in original recording
         detection_sample = start_sample + peak_idx
@@ -959,9 +1303,7 @@ def process_recording(
 
         with wave.open(wav_path, 'r') as wav_in:
             params = wav_in.getparams()
-            frames = wav_in.readframes(wav_in.getnframes())
-            sample_rate = wav_in.getframerate()
-            samples = np.frombuffer(frames, dtype=np.int16).copy()
+            samples, sample_rate = read_wav_samples(wav_path, dtype="int16")
 
             # Insert test beep if requested
             if insert_test_beep:
@@ -969,12 +1311,11 @@ def process_recording(
                 tone_freq = 1000
                 tone_samples = int(tone_duration * sample_rate)
 
-                # Create sine wave
-                t = np.arange(tone_samples) / sample_rate
-                tone = np.sin(2 * np.pi * tone_freq * t)
-
-                # Scale to 12.5% volume
-                tone = (tone * 4096).astype(np.int16)
+                # Create sine wave at 12.5% volume, computed in float32 throughout
+                phase_inc = np.float32(2 * np.pi * tone_freq / sample_rate)
+                tone = np.sin(phase_inc * np.arange(tone_samples, dtype=np.float32))
+                tone *= np.float32(4096)
+                tone = tone.astype(np.int16)
 
                 # Insert tone
                 tone_end = cut_sample + tone_samples
@@ -990,9 +1331,12 @@ def process_recording(
             fade_samples = int(fade_duration * sample_rate)
             fade_end = fade_start + fade_samples
 
-            for i in range(fade_start, min(fade_end, len(samples))):
-                fade_factor = 1.0 - ((i - fade_start) / fade_samples)
-                samples[i] = int(samples[i] * fade_factor)
+            # Linear ramp applied in one vectorized pass; astype truncates
+            # toward zero like the int() it replaces
+            fade_len = max(0, min(fade_end, len(samples)) - fade_start)
+            fade_factors = 1.0 - np.arange(fade_len) / fade_samples
+            fade_region = samples[fade_start:fade_start + fade_len]
+            samples[fade_start:fade_start + fade_len] = (fade_region * fade_factors).astype(np.int16)
 
             # Truncate after fade
             samples = samples[:fade_end]
@@ -1054,7 +1398,10 @@ def process_recording(
 
             # Convert to MP3 with ID3 tags
             metadata = build_id3_metadata(processed_path)
-            mp3_path = convert_to_mp3(processed_path, logger, metadata=metadata)
+            mp3_path = convert_to_mp3(
+                processed_path, logger, metadata=metadata,
+                samples=samples, sample_rate=sample_rate
+            )
             if mp3_path:
                 logger.info(f"Converted to MP3: {mp3_path}")
                 logger.info(f"  ID3 Title: {metadata['title']}")
@@ -1087,23 +1434,23 @@ def build_id3_metadata(wav_path: str) -> Dict[str, str]:
     # Read sidecar for presenter info
     txt_path = wav_path.replace('_processed.wav', '.txt').replace('.wav', '.txt')
     presenter = None
-    if os.path.exists(txt_path):
-        try:
-            with open(txt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Look for "Presenter: Name" pattern
-                pres_match = re.search(r'^Presenter:\s*(.+)$', content, re.MULTILINE)
-                if pres_match:
-                    presenter = pres_match.group(1).strip()
-                    if presenter.lower() == "not detected":
-                        presenter = None
-                # Look for "Unknown presenter:" pattern
-                if not presenter:
-                    unknown_match = re.search(r'^Unknown presenter:\s*(.+)$', content, re.MULTILINE)
-                    if unknown_match:
-                        presenter = Config.UNKNOWN_PRESENTER_LABEL
-        except Exception:
-            pass
+    try:
+        with open(txt_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+            # Look for "Presenter: Name" pattern
+            pres_match = SIDECAR_PRESENTER_RE.search(content)
+            if pres_match:
+                presenter = pres_match.group(1).strip()
+                if presenter.lower() == "not detected":
+                    presenter = None
+            # Look for "Unknown presenter:" pattern
+            if not presenter:
+                unknown_match = SIDECAR_UNKNOWN_PRESENTER_RE.search(content)
+                if unknown_match:
+                    presenter = Config.UNKNOWN_PRESENTER_LABEL
+    except Exception:
+        # Missing or unreadable sidecar: no presenter tag
+        pass
 
     # Build clean title in format: ShippingForecast-20251219-0047-Richard-Evans-49dB
     title_parts = []
@@ -1155,7 +1502,9 @@ def convert_to_mp3(
     wav_path: str,
     logger: logging.Logger,
     bitrate: str = "64k",
-    metadata: Optional[Dict[str, str]] = None
+    metadata: Optional[Dict[str, str]] = None,
+    samples: Optional[np.ndarray] = None,
+    sample_rate: Optional[int] = None
 ) -> Optional[str]:
     """
     Convert WAV file to MP3 using ffmpeg with ID3 tags.
@@ -1171,6 +1520,10 @@ def convert_to_mp3(
                   - date: Recording date (YYYY-MM-DD)
                   - comment: Additional info
                   - genre: Genre (default: Speech)
+        samples: Optional mono int16 samples already in memory (the content of
+                 wav_path); piped to ffmpeg as raw PCM instead of re-reading
+                 the WAV from disk
+        sample_rate: Sample rate of samples (required with samples)
 
     Returns:
         Path to MP3 file, or None if conversion failed
@@ -1178,8 +1531,14 @@ def convert_to_mp3(
     try:
         mp3_path = wav_path.replace('.wav', '.mp3')
 
-        cmd = [
-            'ffmpeg', '-i', wav_path,
+        if samples is not None:
+            pcm_input = memoryview(np.ascontiguousarray(samples, dtype='<i2')).cast('B')
+            cmd = ['ffmpeg', '-f', 's16le', '-ar', str(sample_rate), '-ac', '1', '-i', '-']
+        else:
+            pcm_input = None
+            cmd = ['ffmpeg', '-i', wav_path]
+
+        cmd += [
             '-codec:a', 'libmp3lame',
             '-b:a', bitrate,
             '-y',  # Overwrite output file
@@ -1205,6 +1564,7 @@ def convert_to_mp3(
         # Run conversion with suppressed output
         result = subprocess.run(
             cmd,
+            input=pcm_input,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             timeout=300  # 5 minute timeout
@@ -1221,6 +1581,45 @@ def convert_to_mp3(
         return None
 
 
+def _try_copy(
+    src_path: Optional[str],
+    target_dir: Path,
+    label: str,
+    logger: logging.Logger
+) -> Optional[Path]:
+    """
+    Copy src_path into target_dir, preserving metadata like shutil.copy2.
+
+    The source is opened once up front; a missing file is treated as absent
+    rather than checked with a separate exists() call.
+
+    Returns:
+        Destination path if the copy was verified, None otherwise
+    """
+    if not src_path:
+        return None
+
+    try:
+        src = open(src_path, 'rb')
+    except FileNotFoundError:
+        logger.debug(f"  {label} not present, skipping: {src_path}")
+        return None
+
+    dest = target_dir / os.path.basename(src_path)
+    with src:
+        src_size = os.fstat(src.fileno()).st_size
+        with open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+    shutil.copystat(src_path, dest)
+
+    if dest.stat().st_size == src_size:
+        logger.info(f"  Backed up {label}: {dest}")
+        return dest
+
+    logger.warning(f"  {label} copy verification failed")
+    return None
+
+
 def backup_to_rack(
     wav_path: str,
     mp3_path: str,
@@ -1264,25 +1663,11 @@ def backup_to_rack(
 
         copied_files = []
 
-        # Copy WAV file if it exists
-        if wav_path and os.path.exists(wav_path):
-            wav_dest = target_dir / os.path.basename(wav_path)
-            shutil.copy2(wav_path, wav_dest)
-            if wav_dest.exists() and wav_dest.stat().st_size == os.path.getsize(wav_path):
-                copied_files.append(("WAV", wav_dest))
-                logger.info(f"  Backed up WAV: {wav_dest}")
-            else:
-                logger.warning(f"  WAV copy verification failed")
-
-        # Copy MP3 file if it exists
-        if mp3_path and os.path.exists(mp3_path):
-            mp3_dest = target_dir / os.path.basename(mp3_path)
-            shutil.copy2(mp3_path, mp3_dest)
-            if mp3_dest.exists() and mp3_dest.stat().st_size == os.path.getsize(mp3_path):
-                copied_files.append(("MP3", mp3_dest))
-                logger.info(f"  Backed up MP3: {mp3_dest}")
-            else:
-                logger.warning(f"  MP3 copy verification failed")
+        # Copy WAV and MP3 files if they exist
+        for label, src in (("WAV", wav_path), ("MP3", mp3_path)):
+            dest = _try_copy(src, target_dir, label, logger)
+            if dest:
+                copied_files.append((label, dest))
 
         return len(copied_files) > 0
 
@@ -1291,6 +1676,29 @@ def backup_to_rack(
         return False
 
 
+# Shared Internet Archive session (reuses TCP/TLS connections across uploads)
+_IA_SESSION = None
+
+# Static Internet Archive metadata, merged with per-recording fields on upload.
+# "subject" must stay a list: internetarchive only expands lists into subject[n].
+_IA_METADATA_BASE = {
+    "mediatype": "audio",
+    "language": "eng",
+    "creator": "BBC Radio 4",
+    "subject": ["BBC", "Shipping Forecast", "Radio 4", "198 kHz", "Maritime Weather", "Longwave"],
+    "licenseurl": "https://creativecommons.org/licenses/by-nc-sa/4.0/",
+}
+
+
+def _get_ia_session():
+    """Return a process-wide internetarchive ArchiveSession, creating it on first use"""
+    global _IA_SESSION
+    if _IA_SESSION is None:
+        import internetarchive as ia
+        _IA_SESSION = ia.get_session()
+    return _IA_SESSION
+
+
 def upload_to_internet_archive(
     mp3_path: str,
     logger: logging.Logger,
@@ -1307,13 +1715,13 @@ def upload_to_internet_archive(
     Returns:
         Archive.org URL if successful, None otherwise
     """
-    try:
-        import internetarchive as ia
-    except ImportError:
+    # The module itself is imported by _get_ia_session
+    if importlib.util.find_spec("internetarchive") is None:
         logger.warning("internetarchive library not installed. Run: pip install internetarchive")
         return None
 
     try:
+        # Checked locally so a missing file fails before any archive.org request
         if not os.path.exists(mp3_path):
             logger.warning(f"MP3 file not found: {mp3_path}")
             return None
@@ -1347,14 +1755,10 @@ def upload_to_internet_archive(
         description += " Recorded from 198 kHz longwave transmission via KiwiSDR network."
 
         metadata = {
+            **_IA_METADATA_BASE,
             "title": title,
             "date": date_str,
-            "mediatype": "audio",
-            "language": "eng",
-            "creator": "BBC Radio 4",
-            "subject": ["BBC", "Shipping Forecast", "Radio 4", "198 kHz", "Maritime Weather", "Longwave"],
             "description": description,
-            "licenseurl": "https://creativecommons.org/licenses/by-nc-sa/4.0/"
         }
 
         # Add presenter as contributor if available
@@ -1365,7 +1769,7 @@ def upload_to_internet_archive(
         logger.info(f"  Identifier: {identifier}")
 
         # Upload
-        item = ia.get_item(identifier)
+        item = _get_ia_session().get_item(identifier)
         responses = item.upload(
             mp3_path,
             metadata=metadata,
@@ -1389,6 +1793,9 @@ def upload_to_internet_archive(
             logger.warning("  Upload returned no response")
             return None
 
+    except FileNotFoundError:
+        logger.warning(f"MP3 file not found: {mp3_path}")
+        return None
     except Exception as e:
         logger.warning(f"Internet Archive upload failed: {e}")
         return None
@@ -1447,22 +1854,21 @@ def notify_recording_status(
     logger: logging.Logger = None,
 ) -> None:
     """Send MQTT notification about recording status."""
-    payload = {
+    has_duration = duration_seconds is not None
+    candidates = {
         "event": "recording",
         "success": success,
         "timestamp": datetime.now(timezone.utc).isoformat(),
+        "duration_seconds": round(duration_seconds, 1) if has_duration else None,
+        "duration_formatted": (
+            f"{int(duration_seconds // 60)}:{int(duration_seconds % 60):02d}" if has_duration else None
+        ),
+        "receiver": receiver or None,
+        "rssi": round(rssi, 1) if rssi is not None else None,
+        "filename": filename or None,
+        "error": error or None,
     }
-    if duration_seconds is not None:
-        payload["duration_seconds"] = round(duration_seconds, 1)
-        payload["duration_formatted"] = f"{int(duration_seconds // 60)}:{int(duration_seconds % 60):02d}"
-    if receiver:
-        payload["receiver"] = receiver
-    if rssi is not None:
-        payload["rssi"] = round(rssi, 1)
-    if filename:
-        payload["filename"] = filename
-    if error:
-        payload["error"] = error
+    payload = {k: v for k, v in candidates.items() if v is not None}
 
     mqtt_publish(payload, logger)
 
@@ -1475,16 +1881,15 @@ def notify_backup_status(
     logger: logging.Logger = None,
 ) -> None:
     """Send MQTT notification about backup status."""
-    payload = {
+    candidates = {
         "event": "backup",
         "destination": destination,
         "success": success,
         "timestamp": datetime.now(timezone.utc).isoformat(),
+        "filename": filename or None,
+        "error": error or None,
     }
-    if filename:
-        payload["filename"] = filename
-    if error:
-        payload["error"] = error
+    payload = {k: v for k, v in candidates.items() if v is not None}
 
     mqtt_publish(payload, logger)
 
@@ -1530,18 +1935,16 @@ def notify_ia_status(
     logger: logging.Logger = None,
 ) -> None:
     """Send MQTT notification about Internet Archive upload status."""
-    payload = {
+    candidates = {
         "event": "archive",
         "destination": "internet_archive",
         "success": success,
         "timestamp": datetime.now(timezone.utc).isoformat(),
+        "url": url or None,
+        "identifier": identifier or None,
+        "error": error or None,
     }
-    if url:
-        payload["url"] = url
-    if identifier:
-        payload["identifier"] = identifier
-    if error:
-        payload["error"] = error
+    payload = {k: v for k, v in candidates.items() if v is not None}
 
     # Include presenter info
     if presenter_result:
@@ -1556,6 +1959,16 @@ def notify_ia_status(
 
 def get_audio_duration(file_path: str) -> float | None:
     """Get duration of audio file in seconds. Works with WAV and MP3."""
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        return None
+    return _audio_duration_cached(file_path, mtime)
+
+
+@functools.lru_cache(maxsize=128)
+def _audio_duration_cached(file_path: str, mtime: float) -> float | None:
+    """Duration lookup keyed on (path, mtime) - a given file version never changes length"""
     try:
         if file_path.lower().endswith('.wav'):
             with wave.open(file_path, 'rb') as wf:
@@ -1563,7 +1976,18 @@ def get_audio_duration(file_path: str) -> float | None:
                 rate = wf.getframerate()
                 return frames / rate
         elif file_path.lower().endswith('.mp3'):
-            # Use ffprobe for MP3
+            # Header-only parse via mutagen (no subprocess), if available
+            try:
+                from mutagen import MutagenError
+                from mutagen.mp3 import MP3
+                try:
+                    return MP3(file_path).info.length
+                except MutagenError:
+                    pass
+            except ImportError:
+                pass
+
+            # Fall back to ffprobe
             result = subprocess.run(
                 [
                     "ffprobe", "-v", "error",
@@ -1592,7 +2016,7 @@ def fetch_candidates(logger: logging.Logger) -> List[str]:
 
     for url in Config.PUBLIC_LIST_URLS:
         try:
-            r = requests.get(url, timeout=Config.DISCOVERY_TIMEOUT)
+            r = HTTP_SESSION.get(url, timeout=Config.DISCOVERY_TIMEOUT)
             r.raise_for_status()
             text = r.text
         except Exception:
@@ -1600,10 +2024,11 @@ def fetch_candidates(logger: logging.Logger) -> List[str]:
             continue
 
         for line in text.splitlines():
-            if not line.strip():
+            # Cheap substring test before any regex work (skips blank lines too)
+            if "://" not in line:
                 continue
 
-            country_hit = any(k in line for k in Config.COUNTRY_KEYS)
+            country_hit = COUNTRY_KEYS_RE.search(line) is not None
 
             for m in HTTP_URL_RE.finditer(line):
                 hp = m.group(1)
@@ -1614,27 +2039,25 @@ def fetch_candidates(logger: logging.Logger) -> List[str]:
                 if port not in ("8073", "8074"):
                     continue
 
-                hint_hit = any(h in host.lower() for h in Config.HOST_HINTS)
+                hint_hit = HOST_HINTS_RE.search(host.lower()) is not None
 
                 if country_hit or hint_hit:
                     found.append(f"{host}:{port}")
 
-    # Merge with seeds, dedupe, shuffle
-    candidates = list(dict.fromkeys(found + Config.SEED_HOSTS))
-    random.shuffle(candidates)
-    return candidates
+    # Merge with seeds, dedupe (cmd_scan samples a random subset)
+    return list(dict.fromkeys(found + Config.SEED_HOSTS))
 
 
-def scan_single_host(
+async def scan_single_host(
     host_port: str,
     index: int,
     total: int,
     logger: logging.Logger
-) -> Dict[str, Any]:
+) -> Tuple[str, Dict[str, Any]]:
     """
-    Scan a single host (for parallel execution)
+    Scan a single host (run concurrently by scan_hosts)
 
-    Returns dict with 'status': 'kept'|'skipped' and relevant data
+    Returns ('kept'|'skipped', row) where row is the data to record
     """
     host, port_str = host_port.rsplit(":", 1)
     port = int(port_str)
@@ -1646,33 +2069,45 @@ def scan_single_host(
 
     logger.info(f"[{index:3d}/{total}] {display_tag:35s} ", extra={'end': ''})
 
-    vals, err = probe_smeter(host, port, Config.PROBE_SEC, logger)
+    # Cheap TCP connect first so dead hosts cost ~1s instead of PROBE_SEC
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=Config.REACHABILITY_TIMEOUT
+        )
+        writer.close()
+    except (OSError, asyncio.TimeoutError) as e:
+        logger.info(f"✗ SKIP - unreachable")
+        return "skipped", {
+            "host": host,
+            "port": port,
+            "reason": f"unreachable: {str(e) or 'timed out'}"
+        }
+
+    vals, err = await probe_smeter_async(host, port, Config.PROBE_SEC)
 
     if err:
         logger.info(f"✗ SKIP - {err}")
-        return {
-            "status": "skipped",
+        return "skipped", {
             "host": host,
             "port": port,
             "reason": err
         }
 
-    avg = statistics.mean(vals)
+    arr = np.asarray(vals, dtype=np.float64)
+    avg = float(arr.mean())
 
     if avg < Config.RSSI_FLOOR:
         logger.info(f"✗ TOO WEAK - {signal_strength_bar(avg)}")
-        return {
-            "status": "skipped",
+        return "skipped", {
             "host": host,
             "port": port,
             "reason": f"weak {avg:.1f}"
         }
 
-    mn, mx = min(vals), max(vals)
+    mn, mx = float(arr.min()), float(arr.max())
     logger.info(f"✓ {signal_strength_bar(avg)} (n={len(vals)})")
 
-    return {
-        "status": "kept",
+    return "kept", {
         "host": host,
         "port": port,
         "avg": round(avg, 1),
@@ -1682,32 +2117,53 @@ def scan_single_host(
     }
 
 
+async def scan_hosts(to_scan: List[str], logger: logging.Logger) -> List[Any]:
+    """
+    Screen all candidates concurrently, at most Config.SCAN_WORKERS at a time
+
+    Returns one scan_single_host result (or the exception it raised) per host
+    """
+    sem = asyncio.Semaphore(Config.SCAN_WORKERS)
+
+    async def _bounded(i: int, hp: str) -> Tuple[str, Dict[str, Any]]:
+        async with sem:
+            return await scan_single_host(hp, i, len(to_scan), logger)
+
+    return await asyncio.gather(
+        *(_bounded(i, hp) for i, hp in enumerate(to_scan, 1)),
+        return_exceptions=True,
+    )
+
+
 def deep_probe_host(
     row: Dict[str, Any],
     index: int,
     logger: logging.Logger
-) -> Optional[Dict[str, Any]]:
-    """Perform deep probe on a single host"""
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Perform deep probe on a single host
+
+    Returns: (status line, result or None on failure). Probes run in
+    parallel, so the caller logs the line once the probe is done.
+    """
     short_host = hostname_short(row["host"])
     display_tag = f'{short_host}:{row["port"]}'
-    logger.info(f"[Deep {index:2d}/20] {display_tag:35s} ", extra={'end': ''})
+    prefix = f"[Deep {index:2d}/20] {display_tag:35s} "
 
     vals, err = probe_smeter(row["host"], row["port"], Config.DEEP_SEC, logger)
 
     if err:
-        logger.info(f"✗ FAILED - {err}")
-        return None
+        return f"{prefix}✗ FAILED - {err}", None
 
-    avg = statistics.mean(vals)
-    med = statistics.median(vals)
-    mn, mx = min(vals), max(vals)
-    stdev = statistics.pstdev(vals) if len(vals) > 1 else 0.0
+    arr = np.asarray(vals, dtype=np.float64)
+    avg = float(arr.mean())
+    med = float(np.median(arr))
+    mn, mx = float(arr.min()), float(arr.max())
+    stdev = float(arr.std()) if arr.size > 1 else 0.0
 
-    logger.info(
-        f'✓ {signal_strength_bar(avg)} | med={med:.1f} σ={stdev:.1f} n={len(vals)}'
-    )
+    line = f'{prefix}✓ {signal_strength_bar(avg)} | med={med:.1f} σ={stdev:.1f} n={len(vals)}'
 
-    return {
+    return line, {
         "host": row["host"],
         "port": row["port"],
         "avg": round(avg, 1),
@@ -1744,25 +2200,17 @@ def cmd_scan(args, logger: logging.Logger) -> int:
     t0 = time.perf_counter()
 
     # Parallel scanning
-    to_scan = discovered[:Config.TARGET_SCAN_COUNT]
-    kept_rows = []
-    skipped_rows = []
-
-    with ThreadPoolExecutor(max_workers=Config.SCAN_WORKERS) as executor:
-        futures = {
-            executor.submit(scan_single_host, hp, i+1, len(to_scan), logger): hp
-            for i, hp in enumerate(to_scan)
-        }
-
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                if result["status"] == "kept":
-                    kept_rows.append({k: v for k, v in result.items() if k != "status"})
-                else:
-                    skipped_rows.append({k: v for k, v in result.items() if k != "status"})
-            except Exception as e:
-                logger.error(f"Scan error: {e}")
+    to_scan = random.sample(discovered, min(len(discovered), Config.TARGET_SCAN_COUNT))
+    # gather() already returns one slot per host in to_scan order
+    results = asyncio.run(scan_hosts(to_scan, logger))
+    screened = []
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Scan error: {result}")
+        else:
+            screened.append(result)
+    kept_rows = [row for status, row in screened if status == "kept"]
+    skipped_rows = [row for status, row in screened if status != "kept"]
 
     screen_s = time.perf_counter() - t0
     kept_rows.sort(key=lambda r: r["avg"], reverse=True)
@@ -1774,17 +2222,29 @@ def cmd_scan(args, logger: logging.Logger) -> int:
         f"{len(skipped_rows)} rejected ({screen_s:.1f}s)"
     )
 
-    # Deep probe top 20 (sequential is fine here, only 20 hosts)
+    # Deep probe top 20 (parallel - each probe is DEEP_SEC of network wait)
     deep = []
     logger.info("")
     logger.info("━" * 80)
     logger.info(f"  Phase 2: Deep Analysis (20-second probe on top {len(top20)} receivers)")
     logger.info("━" * 80)
 
-    for i, row in enumerate(top20, 1):
-        result = deep_probe_host(row, i, logger)
-        if result:
-            deep.append(result)
+    if top20:
+        with ThreadPoolExecutor(max_workers=min(10, len(top20))) as executor:
+            futures = {
+                executor.submit(deep_probe_host, row, i, logger): row
+                for i, row in enumerate(top20, 1)
+            }
+
+            # One line per host, logged here as each probe finishes
+            for future in as_completed(futures):
+                try:
+                    line, result = future.result()
+                    logger.info(line)
+                    if result:
+                        deep.append(result)
+                except Exception as e:
+                    logger.error(f"Deep probe error ({futures[future]['host']}): {e}")
 
     deep.sort(key=lambda r: r["avg"], reverse=True)
     total_s = time.perf_counter() - t0
@@ -1810,15 +2270,26 @@ def cmd_scan(args, logger: logging.Logger) -> int:
     ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
     scan_path = os.path.join(Config.SCAN_DIR, f"scan_198_{ts}.json")
 
-    with open(scan_path, "w") as f:
-        json.dump(payload, f, indent=2)
+    # Serialize once: write the pointer atomically, then expose the same
+    # bytes under the timestamped name via a hardlink
+    if orjson is not None:
+        blob = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        blob = json.dumps(payload, indent=2).encode("utf-8")
 
-    # Update pointer atomically
     tmp = Config.SCAN_POINTER + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(payload, f, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(blob)
     os.replace(tmp, Config.SCAN_POINTER)
 
+    try:
+        os.link(Config.SCAN_POINTER, scan_path)
+    except OSError:
+        # Cross-device or no hardlink support: write the already-serialized
+        # bytes rather than copying (re-reading) the pointer file
+        with open(scan_path, "wb") as f:
+            f.write(blob)
+
     # Final summary
     logger.info("")
     logger.info("=" * 80)
@@ -1875,6 +2346,20 @@ def cmd_scan(args, logger: logging.Logger) -> int:
 # RECORD COMMAND
 # ============================================================================
 
+def load_scan_file(ptr_path: str) -> Dict[str, Any]:
+    """Parse a scan results file, using orjson straight from an mmap when available"""
+    with open(ptr_path, "rb") as f:
+        # orjson parses any buffer, so skip the userspace copy of the file
+        # (mmap can't map an empty file; that falls through to the decode error)
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def pick_site_from_scan(
     ptr_path: str,
     logger: logging.Logger
@@ -1884,13 +2369,11 @@ def pick_site_from_scan(
 
     Returns: (host, port, scan_avg, warning_message)
     """
-    if not os.path.exists(ptr_path):
+    try:
+        data = load_scan_file(ptr_path)
+    except FileNotFoundError:
         logger.warning(f"No scan file at {ptr_path}, using fallback")
         return (Config.FALLBACK_HOST, Config.FALLBACK_PORT, None, "no-scan-file")
-
-    try:
-        with open(ptr_path) as f:
-            data = json.load(f)
     except Exception as e:
         logger.error(f"Failed to read scan file: {e}")
         return (Config.FALLBACK_HOST, Config.FALLBACK_PORT, None, f"scan-read-error: {e}")
@@ -1920,13 +2403,11 @@ def pick_top_n_sites_from_scan(
 
     Returns: List of (host, port, scan_avg) tuples, up to N items
     """
-    if not os.path.exists(ptr_path):
+    try:
+        data = load_scan_file(ptr_path)
+    except FileNotFoundError:
         logger.warning(f"No scan file at {ptr_path}, returning fallback only")
         return [(Config.FALLBACK_HOST, Config.FALLBACK_PORT, None)]
-
-    try:
-        with open(ptr_path) as f:
-            data = json.load(f)
     except Exception as e:
         logger.error(f"Failed to read scan file: {e}")
         return [(Config.FALLBACK_HOST, Config.FALLBACK_PORT, None)]
@@ -1990,7 +2471,13 @@ def write_sidecar(
     """Write sidecar text file with recording metadata and shipping forecast"""
     txt = path_wav.replace(".wav", ".txt")
     now_utc = datetime.now(timezone.utc)
-    now_lon = now_utc.astimezone(ZoneInfo("Europe/London"))
+    now_lon = now_utc.astimezone(LONDON_TZ)
+
+    # Add shipping forecast if available
+    forecast_block = (
+        f"\n\n{SIDECAR_SEP}\nSHIPPING FORECAST (Met Office)\n{SIDECAR_SEP}\n\n{forecast_html}"
+        if forecast_html else ""
+    )
 
     body = (
         "Station recording summary\n"
@@ -2005,15 +2492,9 @@ def write_sidecar(
         "  Received via KiwiSDR network (https://kiwisdr.com)\n"
         f"  Receiver host: {host}:{port}\n"
         "Use non-commercially and credit the receiver operator where possible.\n"
+        f"{forecast_block}"
     )
 
-    # Add shipping forecast if available
-    if forecast_html:
-        body += "\n\n" + "="*70 + "\n"
-        body += "SHIPPING FORECAST (Met Office)\n"
-        body += "="*70 + "\n\n"
-        body += forecast_html
-
     with open(txt, "w", encoding="utf-8") as f:
         f.write(body)
 
@@ -2037,44 +2518,45 @@ def update_sidecar_with_presenter(
         True if updated successfully
     """
     try:
-        if not os.path.exists(txt_path):
-            logger.warning(f"[presenter] Sidecar file not found: {txt_path}")
-            return False
-
-        # Read existing content
-        with open(txt_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         # Build presenter section
-        presenter_section = "\n" + "="*70 + "\n"
-        presenter_section += "PRESENTER\n"
-        presenter_section += "="*70 + "\n\n"
-
         if presenter_result.get("presenter"):
-            presenter_section += f"Presenter: {presenter_result['presenter']}\n"
-            presenter_section += f"Confidence: {presenter_result['confidence']:.2f}\n"
-            presenter_section += f"Match type: {presenter_result['match_type']}\n"
+            body_lines = (
+                f"Presenter: {presenter_result['presenter']}",
+                f"Confidence: {presenter_result['confidence']:.2f}",
+                f"Match type: {presenter_result['match_type']}",
+            )
         elif presenter_result.get("raw_match"):
-            presenter_section += f"Unknown presenter: {presenter_result['raw_match']}\n"
-            presenter_section += "(Not in known presenters database)\n"
+            body_lines = (
+                f"Unknown presenter: {presenter_result['raw_match']}",
+                "(Not in known presenters database)",
+            )
         else:
-            presenter_section += "Presenter: Not detected\n"
-            presenter_section += f"Status: {presenter_result.get('match_type', 'unknown')}\n"
+            body_lines = (
+                "Presenter: Not detected",
+                f"Status: {presenter_result.get('match_type', 'unknown')}",
+            )
+        section_body = "\n".join(body_lines)
+        presenter_section = SIDECAR_PRESENTER_SECTION.format(body=section_body)
 
         # Insert presenter section before the shipping forecast section (if present)
-        # or at the end
-        forecast_marker = "="*70 + "\nSHIPPING FORECAST"
-        if forecast_marker in content:
-            content = content.replace(forecast_marker, presenter_section + "\n" + forecast_marker)
-        else:
-            content += presenter_section
-
-        # Write back
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # or at the end. Splice in place: only the bytes after the insertion
+        # point are rewritten, the prefix is left untouched on disk.
+        forecast_marker = SIDECAR_FORECAST_MARKER.encode("utf-8")
+        section = presenter_section.encode("utf-8")
+        with open(txt_path, 'r+b') as f:
+            content = f.read()
+            idx = content.find(forecast_marker)
+            if idx != -1:
+                f.seek(idx)
+                f.write(section + b"\n" + content[idx:])
+            else:
+                f.write(section)
 
         return True
 
+    except FileNotFoundError:
+        logger.warning(f"[presenter] Sidecar file not found: {txt_path}")
+        return False
     except Exception as e:
         logger.warning(f"[presenter] Failed to update sidecar: {e}")
         return False
@@ -2102,7 +2584,7 @@ def generate_recording_json(
     """
     try:
         now_utc = datetime.now(timezone.utc)
-        now_lon = now_utc.astimezone(ZoneInfo("Europe/London"))
+        now_lon = now_utc.astimezone(LONDON_TZ)
 
         data = {
             "version": 1,
@@ -2304,7 +2786,9 @@ def record_audio_parallel(
         try:
             # Get fresh RSSI before recording
             fresh_vals, err = probe_smeter(task["host"], task["port"], Config.RSSI_REFRESH_SEC, logger)
-            task["fresh_rssi"] = statistics.mean(fresh_vals) if fresh_vals else task["scan_avg"]
+            task["fresh_rssi"] = (
+                float(np.mean(np.asarray(fresh_vals, dtype=np.float64))) if fresh_vals else task["scan_avg"]
+            )
 
             logger.info(f"[parallel r{task['index']}] Recording from {task['host']}:{task['port']} (RSSI: {task['fresh_rssi']} dBFS)")
 
@@ -2400,6 +2884,68 @@ def update_latest_symlink(wav_path: str, logger: logging.Logger) -> None:
         logger.warning(f"latest.wav symlink not updated: {e}")
 
 
+def run_rack_backup(
+    wav_path: str,
+    mp3_path: Optional[str],
+    logger: logging.Logger
+) -> Tuple[bool, Optional[str]]:
+    """Back up a finished recording to the Rack, returning (success, error)"""
+    rack_success = False
+    rack_error = None
+    try:
+        logger.info("[backup] Copying files to Rack...")
+        if backup_to_rack(wav_path, mp3_path, logger):
+            logger.info("[backup] Files backed up to Rack successfully")
+            rack_success = True
+        else:
+            rack_error = "Backup incomplete or Rack not mounted"
+            logger.warning("[backup] Backup to Rack failed or incomplete")
+    except Exception as e:
+        rack_error = str(e)
+        logger.warning(f"[backup] Backup failed: {e}")
+
+    return rack_success, rack_error
+
+
+def run_ia_upload(
+    mp3_path: Optional[str],
+    presenter_result: Optional[Dict[str, Any]],
+    logger: logging.Logger
+) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Upload a finished recording to Internet Archive, returning (success, url, error)"""
+    ia_success = False
+    ia_url = None
+    ia_error = None
+    if not Config.IA_UPLOAD_ENABLED:
+        logger.info("[archive] IA uploads disabled (backup mode)")
+        ia_error = "Uploads disabled (backup mode)"
+    elif mp3_path:
+        try:
+            logger.info("[archive] Uploading to Internet Archive...")
+            # Use presenter name, or "Unknown Announcer" if we detected someone but couldn't identify them
+            if presenter_result:
+                presenter_name = presenter_result.get("presenter")
+                if not presenter_name and presenter_result.get("raw_match"):
+                    presenter_name = Config.UNKNOWN_PRESENTER_LABEL
+            else:
+                presenter_name = None
+            ia_url = upload_to_internet_archive(mp3_path, logger, presenter=presenter_name)
+            if ia_url:
+                logger.info(f"[archive] Uploaded: {ia_url}")
+                ia_success = True
+            else:
+                ia_error = "Upload returned no URL"
+                logger.warning("[archive] Upload to Internet Archive failed")
+        except Exception as e:
+            ia_error = str(e)
+            logger.warning(f"[archive] Upload failed: {e}")
+    else:
+        ia_error = "No MP3 file available"
+        logger.warning("[archive] Skipping Internet Archive upload - no MP3 file available")
+
+    return ia_success, ia_url, ia_error
+
+
 def cmd_record(args, logger: logging.Logger) -> int:
     """Execute record command - record from best receiver"""
     logger.info(f"[start] Record @ {time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
@@ -2540,20 +3086,15 @@ def cmd_record(args, logger: logging.Logger) -> int:
         logger=logger,
     )
 
-    # Backup to Rack
-    rack_success = False
-    rack_error = None
-    try:
-        logger.info("[backup] Copying files to Rack...")
-        if backup_to_rack(wav_path, mp3_path, logger):
-            logger.info("[backup] Files backed up to Rack successfully")
-            rack_success = True
-        else:
-            rack_error = "Backup incomplete or Rack not mounted"
-            logger.warning("[backup] Backup to Rack failed or incomplete")
-    except Exception as e:
-        rack_error = str(e)
-        logger.warning(f"[backup] Backup failed: {e}")
+    # Rack backup and IA upload are independent network/disk-bound steps, so
+    # run them side by side instead of letting a slow IA upload wait on the
+    # Rack copy. Notifications stay on this thread, in the original order,
+    # since both publish to the same retained MQTT topic.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rack_future = executor.submit(run_rack_backup, wav_path, mp3_path, logger)
+        ia_future = executor.submit(run_ia_upload, mp3_path, presenter_result, logger)
+        rack_success, rack_error = rack_future.result()
+        ia_success, ia_url, ia_error = ia_future.result()
 
     notify_backup_status(
         destination="rack",
@@ -2563,37 +3104,6 @@ def cmd_record(args, logger: logging.Logger) -> int:
         logger=logger,
     )
 
-    # Upload to Internet Archive
-    ia_success = False
-    ia_url = None
-    ia_error = None
-    if not Config.IA_UPLOAD_ENABLED:
-        logger.info("[archive] IA uploads disabled (backup mode)")
-        ia_error = "Uploads disabled (backup mode)"
-    elif mp3_path:
-        try:
-            logger.info("[archive] Uploading to Internet Archive...")
-            # Use presenter name, or "Unknown Announcer" if we detected someone but couldn't identify them
-            if presenter_result:
-                presenter_name = presenter_result.get("presenter")
-                if not presenter_name and presenter_result.get("raw_match"):
-                    presenter_name = Config.UNKNOWN_PRESENTER_LABEL
-            else:
-                presenter_name = None
-            ia_url = upload_to_internet_archive(mp3_path, logger, presenter=presenter_name)
-            if ia_url:
-                logger.info(f"[archive] Uploaded: {ia_url}")
-                ia_success = True
-            else:
-                ia_error = "Upload returned no URL"
-                logger.warning("[archive] Upload to Internet Archive failed")
-        except Exception as e:
-            ia_error = str(e)
-            logger.warning(f"[archive] Upload failed: {e}")
-    else:
-        ia_error = "No MP3 file available"
-        logger.warning("[archive] Skipping Internet Archive upload - no MP3 file available")
-
     notify_ia_status(
         success=ia_success,
         url=ia_url,
@@ -2606,7 +3116,7 @@ def cmd_record(args, logger: logging.Logger) -> int:
     now = datetime.now(timezone.utc)
     logger.info(
         f"Health: {now.isoformat(timespec='seconds')}Z | "
-        f"London: {now.astimezone(ZoneInfo('Europe/London')).strftime('%Y-%m-%d %H:%M:%S %Z')}"
+        f"London: {now.astimezone(LONDON_TZ).strftime('%Y-%m-%d %H:%M:%S %Z')}"
     )
 
     return 0
@@ -2621,121 +3131,140 @@ def rfc2822(t: float) -> str:
     return email.utils.formatdate(t, usegmt=True)
 
 
-def list_audio_files() -> List[Tuple[float, str, int]]:
-    """Return [(mtime, filename, size)] newest first, limited to MAX_ITEMS.
+# When several formats share a basename, the lowest rank is published
+AUDIO_EXT_PRIORITY = {".mp3": 0, ".wav": 1, ".m4a": 2}
+
+
+def list_audio_files() -> List[Tuple[float, str, int, Optional[str]]]:
+    """Return [(mtime, filename, size, sidecar_path)] newest first, limited to MAX_ITEMS.
 
     Prefers MP3 files over WAV files when both exist with the same basename.
+    A single os.scandir pass collects audio files and sidecar .txt names, so
+    sidecars are resolved from the listing instead of per-item exists() checks.
     """
-    base_dir = Path(Config.OUT_DIR)
     items = []
 
-    if not base_dir.exists():
+    try:
+        entries = os.scandir(Config.OUT_DIR)
+    except FileNotFoundError:
         return items
 
-    # First pass: collect all files
-    all_files = {}
-    for p in base_dir.iterdir():
-        if not p.is_file():
-            continue
-        # Skip symlinks (like latest.wav)
-        if p.is_symlink():
-            continue
-        if not p.name.lower().endswith(Config.AUDIO_EXTS):
-            continue
-        # Only include processed files in feed (skip originals)
-        if '_processed' not in p.name and p.name.startswith('ShippingFCST-'):
-            continue
+    # Single pass: keep the preferred format per basename and note sidecars
+    best = {}
+    txt_names = set()
+    with entries:
+        for entry in entries:
+            name = entry.name
+            # Classify by extension first, lowercasing only the short suffix
+            dot = name.rfind(".")
+            if dot < 0:
+                continue
+            ext = name[dot:].lower()
+            is_txt = ext == ".txt"
+            rank = AUDIO_EXT_PRIORITY.get(ext)
+            if not is_txt and (rank is None or ext not in Config.AUDIO_EXTS):
+                continue
+            # Skip symlinks (like latest.wav) and anything that isn't a regular file
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if is_txt:
+                txt_names.add(name)
+                continue
+            # Only include processed files in feed (skip originals)
+            if '_processed' not in name and name.startswith('ShippingFCST-'):
+                continue
 
-        try:
-            st = p.stat()
-        except Exception:
-            continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
 
-        # Get basename without extension
-        basename = p.stem
-        ext = p.suffix.lower()
+            # Prefer MP3, then WAV, then M4A for the same basename
+            basename = name[:dot]
+            current = best.get(basename)
+            if current is None or rank < current[0]:
+                best[basename] = (rank, st.st_mtime, name, st.st_size)
+
+    # Only the newest MAX_FEED_ITEMS are published: select them with a bounded
+    # heap, then resolve sidecars (which needs every .txt name) for those alone
+    newest = heapq.nlargest(
+        Config.MAX_FEED_ITEMS,
+        ((mtime, name, size, basename) for basename, (_, mtime, name, size) in best.items()),
+    )
+    for mtime, name, size, basename in newest:
+        items.append((mtime, name, size, find_sidecar_path(name, basename, txt_names)))
+    return items
 
-        # Store file info keyed by basename
-        if basename not in all_files:
-            all_files[basename] = {}
 
-        all_files[basename][ext] = (st.st_mtime, p.name, st.st_size)
+def find_sidecar_path(audio_name: str, basename: str, txt_names: set) -> Optional[str]:
+    """Resolve the sidecar .txt for an audio file from a directory listing"""
+    # Direct suffix replacement first
+    txt_name = basename + ".txt"
+    if txt_name in txt_names:
+        return os.path.join(Config.OUT_DIR, txt_name)
 
-    # Second pass: prefer MP3 over WAV for each basename
-    for basename, files_dict in all_files.items():
-        if '.mp3' in files_dict:
-            # Prefer MP3 if it exists
-            items.append(files_dict['.mp3'])
-        elif '.wav' in files_dict:
-            # Fall back to WAV
-            items.append(files_dict['.wav'])
-        elif '.m4a' in files_dict:
-            # Fall back to M4A
-            items.append(files_dict['.m4a'])
+    # For processed files, also try the non-processed sidecar
+    # e.g., "foo_processed.mp3" -> "foo.txt"
+    if "_processed" in audio_name:
+        txt_name = audio_name.replace("_processed.mp3", ".txt").replace("_processed.wav", ".txt")
+        if txt_name in txt_names:
+            return os.path.join(Config.OUT_DIR, txt_name)
+
+    return None
 
-    items.sort(reverse=True)
-    return items[:Config.MAX_FEED_ITEMS]
+
+AUDIO_MIME_TYPES = {".mp3": "audio/mpeg", ".m4a": "audio/mp4", ".wav": "audio/wav"}
 
 
 def guess_mime_type(name: str) -> str:
     """Guess MIME type from filename extension"""
-    n = name.lower()
-    if n.endswith(".mp3"):
-        return "audio/mpeg"
-    if n.endswith(".m4a"):
-        return "audio/mp4"
-    return "audio/wav"
+    return AUDIO_MIME_TYPES.get(os.path.splitext(name)[1].lower(), "audio/wav")
 
 
-def parse_filename_metadata(name: str) -> Dict[str, Any]:
-    """Extract metadata from filename"""
+@functools.lru_cache(maxsize=256)
+def parse_filename_metadata(name: str) -> Mapping[str, Any]:
+    """Extract metadata from filename (cached; returned mapping is read-only)"""
     m = FILENAME_PATTERN.search(name)
     if not m:
-        return {}
+        return MappingProxyType({})
 
     yymmdd, ampm, hhmmss, host_short, avg_int = m.groups()
-    return {
+    return MappingProxyType({
         "yymmdd": yymmdd,
         "ampm": ampm,
         "hhmmss": hhmmss,
         "host_short": host_short,
         "avg_int": int(avg_int),
-    }
+    })
 
 
-def parse_ampm_time_str(name: str) -> str:
-    """Return 'AM 05:19 UTC' for titles"""
-    d = parse_filename_metadata(name)
+def format_ampm_time_str(d: Optional[Mapping[str, Any]]) -> str:
+    """Return 'AM 05:19 UTC' for titles from already-parsed filename metadata"""
     if not d:
         return ""
     hhmm = f"{d['hhmmss'][:2]}:{d['hhmmss'][2:4]}"
     return f"{d['ampm']} {hhmm} UTC"
 
 
-def read_sidecar_text(audio_name: str) -> Optional[str]:
-    """Read sidecar .txt file if present"""
-    audio_path = Path(Config.OUT_DIR) / audio_name
+def parse_ampm_time_str(name: str) -> str:
+    """Return 'AM 05:19 UTC' for titles"""
+    return format_ampm_time_str(parse_filename_metadata(name))
+
 
-    # Try direct suffix replacement first
-    txt_path = audio_path.with_suffix(".txt")
+def read_sidecar_text(txt_path: Optional[str]) -> Optional[str]:
+    """Read a sidecar .txt file located by list_audio_files"""
+    if not txt_path:
+        return None
     try:
-        if txt_path.exists() and txt_path.is_file():
-            return txt_path.read_text(encoding="utf-8")
+        with open(txt_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < SIDECAR_MMAP_MIN_BYTES:
+                return f.read().decode("utf-8")
+            # Decode directly from the page-cache mapping (no read() copy)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return str(mm, "utf-8")
     except Exception:
-        pass
-
-    # For processed files, also try the non-processed sidecar
-    # e.g., "foo_processed.mp3" -> "foo.txt"
-    if "_processed" in audio_name:
-        base_name = audio_name.replace("_processed.mp3", ".txt").replace("_processed.wav", ".txt")
-        alt_txt_path = Path(Config.OUT_DIR) / base_name
-        try:
-            if alt_txt_path.exists() and alt_txt_path.is_file():
-                return alt_txt_path.read_text(encoding="utf-8")
-        except Exception:
-            pass
-
-    return None
+        return None
 
 
 def extract_presenter_from_sidecar(sidecar_text: str) -> tuple:
@@ -2751,55 +3280,61 @@ def extract_presenter_from_sidecar(sidecar_text: str) -> tuple:
         return None, False
 
     # Look for "Presenter: Name" pattern
-    match = re.search(r"^Presenter:\s*(.+)$", sidecar_text, re.MULTILINE)
+    match = SIDECAR_PRESENTER_RE.search(sidecar_text)
     if match:
         presenter = match.group(1).strip()
         if presenter and presenter.lower() != "not detected":
             return presenter, False
 
     # Check for "Unknown presenter:" pattern
-    unknown_match = re.search(r"^Unknown presenter:\s*(.+)$", sidecar_text, re.MULTILINE)
+    unknown_match = SIDECAR_UNKNOWN_PRESENTER_RE.search(sidecar_text)
     if unknown_match:
         return None, True  # Indicate unknown presenter was detected
 
     return None, False
 
 
-def make_description(name: str, mtime: float, metadata: Dict[str, Any]) -> str:
-    """Build description/summary for feed item"""
-    side = read_sidecar_text(name)
+def make_description(
+    name: str,
+    mtime: float,
+    metadata: Mapping[str, Any],
+    side: Optional[str]
+) -> str:
+    """Build description/summary for feed item from already-read sidecar text"""
     if side:
         # Parse sidecar and format nicely for podcast apps
         lines = []
 
-        # Extract key information from sidecar
-        presenter_match = re.search(r"^Presenter:\s*(.+)$", side, re.MULTILINE)
-        confidence_match = re.search(r"^Confidence:\s*(.+)$", side, re.MULTILINE)
-        match_type_match = re.search(r"^Match type:\s*(.+)$", side, re.MULTILINE)
-        host_match = re.search(r"^Host\s*:\s*(.+)$", side, re.MULTILINE)
-        rssi_match = re.search(r"^RSSI\s*:\s*(.+)$", side, re.MULTILINE)
-        utc_match = re.search(r"^UTC\s*:\s*(.+)$", side, re.MULTILINE)
-
-        # Extract synopsis and gale warnings from Met Office section
-        synopsis_match = re.search(r"<h2>The general synopsis at \d+</h2>\s*<p>(.+?)</p>", side)
-        gale_warning_match = re.search(r'<p class="warning">\s*There are.*?in\s+(.+?)\s*</p>', side, re.DOTALL)
+        # Extract key information from sidecar (first occurrence of each field wins)
+        fields: Dict[str, str] = {}
+        for m in SIDECAR_FIELDS_RE.finditer(side):
+            fields.setdefault(m.group(1), m.group(2).strip())
+        presenter = fields.get("Presenter")
+        conf = fields.get("Confidence")
+        match_type = fields.get("Match type")
+        host = fields.get("Host")
+        rssi = fields.get("RSSI")
+        date_str = fields.get("UTC")
+
+        # Extract synopsis and gale warnings from Met Office section; a plain
+        # substring test skips the regex scans when no forecast was embedded
+        if SIDECAR_FORECAST_MARKER in side:
+            synopsis_match = FORECAST_SYNOPSIS_RE.search(side)
+            gale_warning_match = FORECAST_GALE_WARNING_RE.search(side)
+        else:
+            synopsis_match = gale_warning_match = None
 
         # Build formatted description
-        if utc_match:
-            date_str = utc_match.group(1).strip()
+        if date_str:
             lines.append(f"BBC Shipping Forecast")
             lines.append(f"Broadcast: {date_str}")
 
-        if presenter_match:
-            presenter = presenter_match.group(1).strip()
+        if presenter:
             lines.append(f"Presented by: {presenter}")
 
             # Add detection confidence if available
-            if confidence_match and match_type_match:
-                conf = confidence_match.group(1).strip()
-                match_type = match_type_match.group(1).strip()
-                if float(conf) < 1.0 or match_type != "exact":
-                    lines.append(f"(Presenter detected via {match_type}, confidence: {conf})")
+            if conf and match_type and (float(conf) < 1.0 or match_type != "exact"):
+                lines.append(f"(Presenter detected via {match_type}, confidence: {conf})")
 
         lines.append("")  # Blank line
 
@@ -2813,18 +3348,16 @@ def make_description(name: str, mtime: float, metadata: Dict[str, Any]) -> str:
         if gale_warning_match:
             areas = gale_warning_match.group(1).strip()
             # Clean up HTML entities and whitespace
-            areas = re.sub(r'\s+', ' ', areas)
+            areas = WHITESPACE_RUN_RE.sub(' ', areas)
             areas = areas.replace(' and ', ', ')
             lines.append(f"Gale warnings: {areas}")
             lines.append("")
 
         # Add recording details
         lines.append("RECORDING DETAILS")
-        if host_match:
-            host = host_match.group(1).strip()
+        if host:
             lines.append(f"Receiver: {host}")
-        if rssi_match:
-            rssi = rssi_match.group(1).strip()
+        if rssi:
             lines.append(f"Signal strength: {rssi}")
         lines.append(f"Frequency: {Config.FREQ_KHZ} kHz longwave")
         lines.append("")
@@ -2834,7 +3367,7 @@ def make_description(name: str, mtime: float, metadata: Dict[str, Any]) -> str:
         return "\n".join(lines).strip()
 
     # Fallback: synthesize from metadata
-    ampm_str = parse_ampm_time_str(name) or ""
+    ampm_str = format_ampm_time_str(metadata)
     host = metadata.get("host_short", "unknown")
     avg = metadata.get("avg_int", "??")
 
@@ -2852,42 +3385,144 @@ def make_description(name: str, mtime: float, metadata: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def make_feed_item(name: str, size: int, mtime: float) -> str:
-    """Generate RSS item XML for a single audio file"""
+FEED_HEAD_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+  xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+  xmlns:atom="http://www.w3.org/2005/Atom">
+<channel>
+  <title>{title}</title>
+  <link>{base_url}/</link>
+  <description>{desc}</description>
+  <language>{lang}</language>
+  <lastBuildDate>{now}</lastBuildDate>
+  <atom:link rel="self" type="application/rss+xml" href="{base_url}/feed.xml"/>
+  <itunes:author>{author}</itunes:author>
+  <itunes:summary>{desc}</itunes:summary>
+  <itunes:category text="News">
+    <itunes:category text="Weather"/>
+  </itunes:category>
+'''
+
+FEED_IMAGE_TEMPLATE = """  <image>
+    <url>{art_url}</url>
+    <title>{title}</title>
+    <link>{base_url}/</link>
+  </image>
+  <itunes:image href="{art_url}" />
+"""
+
+FEED_ITEM_TEMPLATE = """  <item>
+    <title>{title}</title>
+    <pubDate>{pub}</pubDate>
+    <enclosure url="{url}" length="{size}" type="{ctype}"/>
+    <guid isPermaLink="false">{guid}</guid>
+    <description>{desc}</description>
+    <itunes:summary>{desc}</itunes:summary>
+  </item>"""
+
+FEED_TAIL = "\n</channel>\n</rss>\n"
+
+# Channel-level strings never change during a run, so escape them once
+FEED_TITLE_XML = html.escape(Config.FEED_TITLE)
+FEED_DESC_XML = html.escape(Config.FEED_DESC)
+FEED_LANG_XML = html.escape(Config.FEED_LANG)
+FEED_AUTHOR_XML = html.escape(Config.FEED_AUTHOR)
+FEED_ITEM_TITLE_PREFIX_XML = html.escape("Shipping Forecast – ")
+
+# Same substitutions as html.escape(quote=True), applied in a single C-level pass
+XML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def xml_escape(text: str) -> str:
+    """Escape text for XML content/attributes (equivalent to html.escape)"""
+    return text.translate(XML_ESCAPE_TABLE)
+
+
+def write_feed_item(
+    out: TextIO, name: str, size: int, mtime: float, sidecar_text: Optional[str]
+) -> None:
+    """Write RSS item XML for a single audio file to out (sidecar read once by caller)"""
     url = f"{Config.BASE_URL}/{quote(name)}"
     ctype = guess_mime_type(name)
-    guid = html.escape(name)
+    guid = xml_escape(name)
     pub = rfc2822(mtime)
 
-    # Read sidecar for presenter info
-    sidecar_text = read_sidecar_text(name)
+    # Filename metadata is parsed once and shared by the title and description
+    metadata = parse_filename_metadata(name)
+
+    # Presenter info from sidecar
     presenter, is_unknown = extract_presenter_from_sidecar(sidecar_text)
 
     # Title (include presenter if available, or "Unknown Announcer" if unknown was detected)
-    time_str = parse_ampm_time_str(name)
-    base_title = os.path.splitext(name)[0]
+    time_str = format_ampm_time_str(metadata)
     if time_str:
-        title = f"Shipping Forecast – {time_str}"
+        # time_str is only AM/PM and digits, so just the presenter needs escaping
+        title_xml = FEED_ITEM_TITLE_PREFIX_XML + time_str
         if presenter:
-            title += f" ({presenter})"
+            title_xml += f" ({xml_escape(presenter)})"
         elif is_unknown:
-            title += f" ({Config.UNKNOWN_PRESENTER_LABEL})"
+            title_xml += f" ({xml_escape(Config.UNKNOWN_PRESENTER_LABEL)})"
     else:
-        title = base_title
+        # Fall back to the bare filename (no extension)
+        title_xml = xml_escape(name.rpartition(".")[0] or name)
 
     # Description
-    metadata = parse_filename_metadata(name)
-    desc = make_description(name, mtime, metadata)
-    desc_xml = html.escape(desc)
+    desc = make_description(name, mtime, metadata, sidecar_text)
+    desc_xml = xml_escape(desc)
+
+    out.write(FEED_ITEM_TEMPLATE.format_map({
+        "title": title_xml,
+        "pub": pub,
+        "url": url,
+        "size": size,
+        "ctype": ctype,
+        "guid": guid,
+        "desc": desc_xml,
+    }))
+
+
+def sidecar_cache_key(txt_path: Optional[str]) -> Optional[List[int]]:
+    """Return [mtime_ns, size] of a sidecar for feed cache validation"""
+    if not txt_path:
+        return None
+    try:
+        st = os.stat(txt_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_feed_item_cache() -> Dict[str, Any]:
+    """Load rendered <item> XML from the previous feed build ({} if unusable)"""
+    try:
+        with open(Config.FEED_ITEM_CACHE, "rb") as f:
+            raw = f.read()
+        cache = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+    # Items embed BASE_URL, so a changed URL invalidates everything
+    if not isinstance(cache, dict) or cache.get("base_url") != Config.BASE_URL:
+        return {}
+    return cache.get("items", {})
 
-    return f"""  <item>
-    <title>{html.escape(title)}</title>
-    <pubDate>{pub}</pubDate>
-    <enclosure url="{url}" length="{size}" type="{ctype}"/>
-    <guid isPermaLink="false">{guid}</guid>
-    <description>{desc_xml}</description>
-    <itunes:summary>{desc_xml}</itunes:summary>
-  </item>"""
+
+def save_feed_item_cache(items: Dict[str, Any], logger: logging.Logger) -> None:
+    """Persist rendered <item> XML for the next feed build"""
+    cache = {"base_url": Config.BASE_URL, "items": items}
+    blob = orjson.dumps(cache) if orjson is not None else json.dumps(cache).encode("utf-8")
+    tmp_path = f"{Config.FEED_ITEM_CACHE}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, Config.FEED_ITEM_CACHE)
+    except OSError as e:
+        logger.warning(f"[make_feed] could not write item cache: {e}")
 
 
 def cmd_feed(args, logger: logging.Logger) -> int:
@@ -2903,42 +3538,58 @@ def cmd_feed(args, logger: logging.Logger) -> int:
     art_path = Path(Config.OUT_DIR) / Config.ART_NAME
     art_url = f"{Config.BASE_URL}/{quote(Config.ART_NAME)}" if art_path.exists() else None
 
-    channel_items = "\n".join(make_feed_item(n, s, t) for t, n, s in items)
-    now = rfc2822(time.time())
-
-    head = f'''<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0"
-  xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
-  xmlns:atom="http://www.w3.org/2005/Atom">
-<channel>
-  <title>{html.escape(Config.FEED_TITLE)}</title>
-  <link>{Config.BASE_URL}/</link>
-  <description>{html.escape(Config.FEED_DESC)}</description>
-  <language>{html.escape(Config.FEED_LANG)}</language>
-  <lastBuildDate>{now}</lastBuildDate>
-  <atom:link rel="self" type="application/rss+xml" href="{Config.BASE_URL}/feed.xml"/>
-  <itunes:author>{html.escape(Config.FEED_AUTHOR)}</itunes:author>
-  <itunes:summary>{html.escape(Config.FEED_DESC)}</itunes:summary>
-  <itunes:category text="News">
-    <itunes:category text="Weather"/>
-  </itunes:category>
-'''
-
-    if art_url:
-        head += f"""  <image>
-    <url>{art_url}</url>
-    <title>{html.escape(Config.FEED_TITLE)}</title>
-    <link>{Config.BASE_URL}/</link>
-  </image>
-  <itunes:image href="{art_url}" />
-"""
+    fields = {
+        "title": FEED_TITLE_XML,
+        "desc": FEED_DESC_XML,
+        "lang": FEED_LANG_XML,
+        "author": FEED_AUTHOR_XML,
+        "base_url": Config.BASE_URL,
+        "now": rfc2822(time.time()),
+        "art_url": art_url,
+    }
 
-    tail = "\n</channel>\n</rss>\n"
+    # Reuse items whose audio file and sidecar are unchanged since the last
+    # build; only the rest need their sidecar read and XML rendered
+    cache = load_feed_item_cache()
+    rendered = {}
+    stale = []
+    for t, n, s, txt in items:
+        key = [t, s, sidecar_cache_key(txt)]
+        entry = cache.get(n)
+        if entry is not None and entry.get("key") == key:
+            rendered[n] = entry
+        else:
+            stale.append((t, n, s, txt, key))
+
+    if stale:
+        # Sidecar reads are independent and I/O-bound, so overlap them
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as executor:
+            sidecars = list(executor.map(read_sidecar_text, [txt for _, _, _, txt, _ in stale]))
+        for (t, n, s, _, key), side in zip(stale, sidecars):
+            buf = io.StringIO()
+            write_feed_item(buf, n, s, t, side)
+            rendered[n] = {"key": key, "xml": buf.getvalue()}
+
+    logger.info(f"[make_feed] rendered {len(stale)} items, reused {len(items) - len(stale)}")
+
+    # Stream fragments straight to disk rather than holding the whole document
+    # in memory; write to a temp file and swap it in so readers never see a
+    # half-written feed
+    ensure_dir(Config.OUT_DIR)
+    tmp_path = f"{Config.FEED_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(FEED_HEAD_TEMPLATE.format_map(fields))
+        if art_url:
+            f.write(FEED_IMAGE_TEMPLATE.format_map(fields))
 
-    xml = head + "\n" + channel_items + tail
+        fragments = []
+        for _, n, _, _ in items:
+            fragments += ("\n", rendered[n]["xml"])
+        f.writelines(fragments)
+        f.write(FEED_TAIL)
+    os.replace(tmp_path, Config.FEED_PATH)
 
-    ensure_dir(Config.OUT_DIR)
-    Config.FEED_PATH.write_text(xml, encoding="utf-8")
+    save_feed_item_cache(rendered, logger)
 
     logger.info(f"[make_feed] wrote {Config.FEED_PATH}")
     return 0
@@ -2958,16 +3609,10 @@ def to_local_hm(lon_time: str) -> Tuple[str, str]:
     Returns:
         Tuple of (hour, minute) in local time
     """
-    import subprocess
-
-    cmd = f'TZ=Europe/London date -d "today {lon_time}" +%s'
-    ts = subprocess.check_output(cmd, shell=True, text=True).strip()
-
-    cmd2 = f'date -d "@{ts}" "+%H %M"'
-    result = subprocess.check_output(cmd2, shell=True, text=True).strip()
-
-    hour, minute = result.split()
-    return hour, minute
+    lon_clock = datetime.strptime(lon_time, "%H:%M").time()
+    lon_dt = datetime.combine(datetime.now(LONDON_TZ).date(), lon_clock, tzinfo=LONDON_TZ)
+    local_dt = lon_dt.astimezone()
+    return f"{local_dt.hour:02d}", f"{local_dt.minute:02d}"
 
 
 def cmd_setup(args, logger: logging.Logger) -> int:
@@ -3038,6 +3683,14 @@ def cmd_setup(args, logger: logging.Logger) -> int:
     # Add new managed block
     new_crontab = "\n".join(lines).strip() + "\n" + managed_block
 
+    # Nothing to install if the managed block is already current
+    if new_crontab.strip() == existing.strip():
+        logger.info(
+            f"Crontab already up to date. "
+            f"Local times -> scan {lh_scan0}:{lm_scan0}, record {lh_rec0}:{lm_rec0}"
+        )
+        return 0
+
     # Install new crontab
     proc = subprocess.Popen(["crontab", "-"], stdin=subprocess.PIPE, text=True)
     proc.communicate(new_crontab)
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 import os, time, email.utils, html, sys, re
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import quote
 from pathlib import Path
 
@@ -17,20 +19,30 @@ DESC   = "Automated 198 kHz Shipping Forecast recordings via KiwiSDR."
 LANG   = "en-gb"
 AUTHOR = "KiwiSDR capture on zigbee"
 
+# Static channel fields, XML-escaped once
+TITLE_XML  = html.escape(TITLE)
+DESC_XML   = html.escape(DESC)
+LANG_XML   = html.escape(LANG)
+AUTHOR_XML = html.escape(AUTHOR)
+TITLE_PREFIX_XML = html.escape("Shipping Forecast – ")
+
 # --- HELPERS ---
 def rfc2822(t): return email.utils.formatdate(t, usegmt=True)
 
 def list_audio():
     """Return [(mtime, filename, size)] newest first, limited to MAX_ITEMS"""
     items = []
-    for p in BASE_DIR.iterdir():
-        if not p.is_file(): continue
-        if not p.name.lower().endswith(AUDIO_EXTS): continue
-        try:
-            st = p.stat()
-        except Exception:
-            continue
-        items.append((st.st_mtime, p.name, st.st_size))
+    with os.scandir(BASE_DIR) as it:
+        for entry in it:
+            dot = entry.name.rfind(".")
+            if dot < 0 or entry.name[dot:].lower() not in AUDIO_EXTS: continue
+            try:
+                # Skip symlinks such as latest.wav (a duplicate of the newest file)
+                if not entry.is_file(follow_symlinks=False): continue
+                st = entry.stat()
+            except Exception:
+                continue
+            items.append((st.st_mtime, entry.name, st.st_size))
     items.sort(reverse=True)
     return items[:MAX_ITEMS]
 
@@ -45,19 +57,24 @@ FNPAT = re.compile(
     r"ShippingFCST-(\d{6})_(AM|PM)_(\d{6})UTC--(.+?)--avg-(\d+)\.[^\.]+$", re.IGNORECASE
 )
 
+@lru_cache(maxsize=256)
 def parse_from_filename(name: str):
-    """Return dict with date, ampm, time, host_short, avg_int or {} if N/A."""
+    """Return read-only mapping with date, ampm, time, host_short, avg_int (empty if N/A).
+
+    Cached because each item parses its filename more than once; the result is
+    a read-only view so the shared cached value can't be mutated by callers.
+    """
     m = FNPAT.search(name)
     if not m:
-        return {}
+        return MappingProxyType({})
     yymmdd, ampm, hhmmss, host_short, avg_int = m.groups()
-    return {
+    return MappingProxyType({
         "yymmdd": yymmdd,
         "ampm": ampm,
         "hhmmss": hhmmss,
         "host_short": host_short,
         "avg_int": int(avg_int),
-    }
+    })
 
 def parse_ampm_time_str(name: str) -> str:
     """Return 'AM 05:19 UTC' for titles."""
@@ -66,12 +83,13 @@ def parse_ampm_time_str(name: str) -> str:
     hhmm = f"{d['hhmmss'][:2]}:{d['hhmmss'][2:4]}"
     return f"{d['ampm']} {hhmm} UTC"
 
-def read_sidecar(for_audio: Path) -> str | None:
+def read_sidecar(for_audio: str) -> str | None:
     """Return sidecar text contents if present, else None."""
-    txt = for_audio.with_suffix(".txt")
+    txt = for_audio[:for_audio.rfind(".")] + ".txt"
     try:
-        if txt.exists() and txt.is_file():
-            return txt.read_text(encoding="utf-8")
+        # Bulk binary read + one decode skips the text-mode reader layer
+        with open(txt, "rb") as f:
+            return f.read().decode("utf-8")
     except Exception:
         pass
     return None
@@ -81,7 +99,7 @@ def make_desc(name: str, mtime: float, fallback_info: dict) -> str:
     Build a description/summary string.
     Prefer sidecar text; otherwise synthesize a compact block.
     """
-    audio_path = BASE_DIR / name
+    audio_path = os.path.join(BASE_DIR, name)
     side = read_sidecar(audio_path)
     if side:
         # Wrap in minimal lines; many apps show plain text (no HTML needed)
@@ -112,8 +130,8 @@ def make_item(name, size, mtime):
 
     # Title
     time_str = parse_ampm_time_str(name)
-    base_title = os.path.splitext(name)[0]
-    title = f"Shipping Forecast – {time_str}" if time_str else base_title
+    # time_str is only AM/PM and digits, so the escaped prefix is reused as-is
+    title_xml = TITLE_PREFIX_XML + time_str if time_str else html.escape(name.rpartition(".")[0] or name)
 
     # Description (and iTunes summary) — prefer sidecar; else synthesize
     fallback = parse_from_filename(name)
@@ -122,7 +140,7 @@ def make_item(name, size, mtime):
     desc_xml = html.escape(desc)
 
     return f"""  <item>
-    <title>{html.escape(title)}</title>
+    <title>{title_xml}</title>
     <pubDate>{pub}</pubDate>
     <enclosure url="{url}" length="{size}" type="{ctype}"/>
     <guid isPermaLink="false">{guid}</guid>
@@ -138,7 +156,6 @@ def build_feed():
         return None
 
     art_url = f"{BASE_URL}/{quote(ART_NAME)}" if ART_PATH.exists() else None
-    channel_items = "\n".join(make_item(n, s, t) for t, n, s in items)
     now = rfc2822(time.time())
 
     head = f'''<?xml version="1.0" encoding="UTF-8"?>
@@ -146,30 +163,36 @@ def build_feed():
   xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
   xmlns:atom="http://www.w3.org/2005/Atom">
 <channel>
-  <title>{html.escape(TITLE)}</title>
+  <title>{TITLE_XML}</title>
   <link>{BASE_URL}/</link>
-  <description>{html.escape(DESC)}</description>
-  <language>{html.escape(LANG)}</language>
+  <description>{DESC_XML}</description>
+  <language>{LANG_XML}</language>
   <lastBuildDate>{now}</lastBuildDate>
   <atom:link rel="self" type="application/rss+xml" href="{BASE_URL}/feed.xml"/>
-  <itunes:author>{html.escape(AUTHOR)}</itunes:author>
-  <itunes:summary>{html.escape(DESC)}</itunes:summary>
+  <itunes:author>{AUTHOR_XML}</itunes:author>
+  <itunes:summary>{DESC_XML}</itunes:summary>
   <itunes:category text="News">
     <itunes:category text="Weather"/>
   </itunes:category>
 '''
-    if art_url:
-        head += f"""  <image>
+    # Stream fragments to a temp file (only one item in memory at a time) and
+    # swap it in so clients never fetch a partial feed
+    tmp = FEED_PATH.with_suffix(".xml.tmp")
+    with open(tmp, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(head)
+        if art_url:
+            f.write(f"""  <image>
     <url>{art_url}</url>
-    <title>{html.escape(TITLE)}</title>
+    <title>{TITLE_XML}</title>
     <link>{BASE_URL}/</link>
   </image>
   <itunes:image href="{art_url}" />
-"""
-    tail = "\n</channel>\n</rss>\n"
-
-    xml = head + "\n" + channel_items + tail
-    FEED_PATH.write_text(xml, encoding="utf-8")
+""")
+        for t, n, s in items:
+            f.write("\n")
+            f.write(make_item(n, s, t))
+        f.write("\n</channel>\n</rss>\n")
+    os.replace(tmp, FEED_PATH)
     print(f"[make_feed] wrote {FEED_PATH}", file=sys.stdout)
     return str(FEED_PATH)
 
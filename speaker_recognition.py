@@ -15,10 +15,20 @@ Usage:
     # Compare embedding against database
     python3 speaker_recognition.py compare <audio_file> <database_json>
 
-    # Batch extract embeddings (for building database)
-    python3 speaker_recognition.py batch <file_list.txt> <output_dir>
+    # Keep the model loaded in a worker; extract/compare use it when running
+    python3 speaker_recognition.py serve [--socket /tmp/speaker_recognition.sock]
 
-Database format (JSON):
+    # Batch extract embeddings (for building database); writes one JSON
+    # result per line as each chunk finishes
+    python3 speaker_recognition.py batch <file_list.txt> <output.ndjson> [--batch-size 32]
+
+    # Torch uses --threads CPU threads (default 4). When running several
+    # instances on one box, also pin each to its own cores:
+    taskset -c 0-3 python3 speaker_recognition.py --threads 4 batch ...
+
+Database format (JSON, plus a stacked float32 copy in database.npz that is
+loaded instead while it matches the JSON's size and mtime; build-database --int8
+stores that copy as int8 with per-row scales, 4x smaller):
 {
     "John Hammond": [
         [0.123, 0.456, ...],  # embedding 1 (512 floats)
@@ -29,7 +39,9 @@ Database format (JSON):
 
 Output format:
 {
-    "embedding": [0.123, 0.456, ...],  # 512 floats
+    "embedding_b64": "...",  # 512 float32s, base64 of the raw bytes
+    "dtype": "float32",
+    # with --legacy-json, also "embedding": [0.123, 0.456, ...]
     "matches": [
         {"name": "John Hammond", "similarity": 0.87, "rank": 1},
         {"name": "Kelsey Bennett", "similarity": 0.45, "rank": 2}
@@ -38,20 +50,42 @@ Output format:
 """
 
 import argparse
+import base64
+import contextlib
 import json
+import os
+import socket
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 
 
-def setup_model():
+# Unix socket for the optional long-lived worker (see cmd_serve)
+DEFAULT_SOCKET = "/tmp/speaker_recognition.sock"
+
+# CPU threads for torch/OpenMP/MKL; by default pyannote's embedding step
+# spreads over every core, which thrashes when several instances share a box
+DEFAULT_THREADS = 4
+
+
+def setup_model(threads: int = DEFAULT_THREADS):
     """
     Load and initialize the speaker embedding model.
 
+    Args:
+        threads: CPU threads for torch (0 leaves the library defaults)
+
     Returns:
         Tuple of (model, device)
     """
+    # OpenMP/MKL read these when torch is first imported
+    if threads > 0:
+        os.environ.setdefault("OMP_NUM_THREADS", str(threads))
+        os.environ.setdefault("MKL_NUM_THREADS", str(threads))
+
     try:
         import torch
         from pyannote.audio import Model, Inference
@@ -59,13 +93,24 @@ def setup_model():
         print(json.dumps({"error": f"Required packages not installed: {e}"}), file=sys.stderr)
         sys.exit(1)
 
+    if threads > 0:
+        torch.set_num_threads(threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # Already fixed once inter-op work has started
+
     # Use GPU if available, otherwise CPU
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    if device.type == "cuda":
+        # TF32 for float32 matmuls left outside the fp16 autocast region
+        torch.set_float32_matmul_precision("high")
 
     # Load pre-trained speaker embedding model
     # Using pyannote/embedding which is a general-purpose speaker embedding model
     try:
         model = Model.from_pretrained("pyannote/embedding")
+        model.eval()
         inference = Inference(model, window="whole", device=device)
     except Exception as e:
         print(json.dumps({"error": f"Failed to load model: {e}"}), file=sys.stderr)
@@ -74,53 +119,114 @@ def setup_model():
     return inference, device
 
 
-def extract_embedding(audio_path: str, inference) -> np.ndarray:
+def load_waveform(audio_path: str) -> Tuple[np.ndarray, int]:
     """
-    Extract speaker embedding from audio file.
+    Load an audio file as a (channels, samples) array.
 
     Args:
         audio_path: Path to audio file (WAV, MP3, etc.)
-        inference: Pyannote inference model
 
     Returns:
-        NumPy array of embedding (512-dimensional vector)
+        Tuple of (waveform, sample_rate)
     """
-    try:
-        # Load audio manually using soundfile to avoid torchcodec issues
-        import soundfile as sf
-        import torch
+    # Load audio manually using soundfile to avoid torchcodec issues. Decode
+    # straight to float32 so torch.from_numpy(...).float() shares the buffer
+    # instead of converting a float64 copy
+    import soundfile as sf
 
-        # Read audio file
-        waveform, sample_rate = sf.read(audio_path)
+    waveform, sample_rate = sf.read(audio_path, dtype="float32")
 
-        # Convert to torch tensor and ensure correct shape
-        if waveform.ndim == 1:
-            waveform = waveform[np.newaxis, :]  # Add channel dimension
-        elif waveform.ndim == 2 and waveform.shape[0] > waveform.shape[1]:
-            waveform = waveform.T  # Transpose if needed (samples, channels) -> (channels, samples)
+    # Ensure (channels, samples) shape
+    if waveform.ndim == 1:
+        waveform = waveform[np.newaxis, :]  # Add channel dimension
+    elif waveform.ndim == 2 and waveform.shape[0] > waveform.shape[1]:
+        waveform = waveform.T  # Transpose if needed (samples, channels) -> (channels, samples)
 
-        # Create dict format expected by pyannote
-        audio_dict = {
-            "waveform": torch.from_numpy(waveform).float(),
-            "sample_rate": sample_rate
-        }
+    return waveform, sample_rate
 
-        # Extract embedding
+
+def forward_context(inference):
+    """
+    Context for a forward pass: no autograd tracking, and fp16 autocast when
+    the model is on CUDA (tensor cores).
+    """
+    import torch
+
+    device = torch.device(getattr(inference, "device", "cpu"))
+    stack = contextlib.ExitStack()
+    stack.enter_context(torch.inference_mode())
+    stack.enter_context(torch.autocast(device_type=device.type, dtype=torch.float16,
+                                       enabled=device.type == "cuda"))
+    return stack
+
+
+def embed_waveform(waveform: np.ndarray, sample_rate: int, inference) -> np.ndarray:
+    """
+    Extract speaker embedding from a loaded (channels, samples) waveform.
+
+    Returns:
+        NumPy array of embedding (512-dimensional vector)
+    """
+    import torch
+
+    # Create dict format expected by pyannote
+    audio_dict = {
+        "waveform": torch.from_numpy(waveform).float(),
+        "sample_rate": sample_rate
+    }
+
+    # Extract embedding
+    with forward_context(inference):
         embedding = inference(audio_dict)
 
-        # Convert to numpy array
-        if hasattr(embedding, 'numpy'):
-            embedding_np = embedding.numpy()
-        elif hasattr(embedding, 'cpu'):
-            embedding_np = embedding.cpu().numpy()
-        else:
-            embedding_np = np.array(embedding)
+    # Convert to numpy array
+    if hasattr(embedding, 'numpy'):
+        embedding_np = embedding.numpy()
+    elif hasattr(embedding, 'cpu'):
+        embedding_np = embedding.cpu().numpy()
+    else:
+        embedding_np = np.array(embedding)
+
+    # Ensure 1D float32 array (autocast may hand back float16)
+    if embedding_np.ndim > 1:
+        embedding_np = embedding_np.flatten()
+
+    return embedding_np.astype(np.float32, copy=False)
+
+
+def embed_waveform_batch(waveforms: List[np.ndarray], inference) -> np.ndarray:
+    """
+    Extract embeddings for same-shape mono waveforms in one forward pass.
+
+    The waveforms must already be at the model's sample rate: this calls
+    Inference.infer directly, which is what a whole-window Inference call
+    runs per file after resampling/downmixing.
+
+    Returns:
+        (B, D) array, one embedding per waveform
+    """
+    import torch
 
-        # Ensure 1D array
-        if embedding_np.ndim > 1:
-            embedding_np = embedding_np.flatten()
+    batch = torch.from_numpy(np.stack(waveforms)).float()
+    with forward_context(inference):
+        embeddings = inference.infer(batch)
+    return np.asarray(embeddings, dtype=np.float32).reshape(len(waveforms), -1)
 
-        return embedding_np
+
+def extract_embedding(audio_path: str, inference) -> np.ndarray:
+    """
+    Extract speaker embedding from audio file.
+
+    Args:
+        audio_path: Path to audio file (WAV, MP3, etc.)
+        inference: Pyannote inference model
+
+    Returns:
+        NumPy array of embedding (512-dimensional vector)
+    """
+    try:
+        waveform, sample_rate = load_waveform(audio_path)
+        return embed_waveform(waveform, sample_rate, inference)
 
     except Exception as e:
         raise RuntimeError(f"Failed to extract embedding: {e}")
@@ -137,37 +243,140 @@ def cosine_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
     Returns:
         Similarity score (0.0 to 1.0, higher is more similar)
     """
-    # Normalize vectors
-    e1_norm = embedding1 / (np.linalg.norm(embedding1) + 1e-8)
-    e2_norm = embedding2 / (np.linalg.norm(embedding2) + 1e-8)
-
-    # Compute cosine similarity
-    similarity = np.dot(e1_norm, e2_norm)
+    # Squared norms via vdot avoid np.linalg.norm's dispatch and the two
+    # normalized temporaries
+    denom = np.sqrt(np.vdot(embedding1, embedding1) * np.vdot(embedding2, embedding2)) + 1e-8
+    similarity = np.dot(embedding1, embedding2) / denom
 
     # Clamp to [0, 1] range
     return float(max(0.0, min(1.0, similarity)))
 
 
-def load_database(database_path: str) -> Dict[str, List[np.ndarray]]:
+def stack_database(
+    data: Dict[str, List[List[float]]]
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Stack a {presenter: [embedding, ...]} database into one matrix.
+
+    All reference embeddings go into one matrix with L2-normalized rows, so a
+    query is compared against the whole database in one matmul.
+
+    Returns:
+        Tuple of (names, matrix, offsets): rows offsets[i]:offsets[i+1] of the
+        (N, D) float32 matrix are the embeddings for names[i]
+    """
+    names = list(data)
+    counts = [len(embeddings) for embeddings in data.values()]
+    offsets = np.zeros(len(names) + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+
+    rows = [emb for embeddings in data.values() for emb in embeddings]
+    if rows:
+        matrix = np.array(rows, dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-8
+    else:
+        matrix = np.empty((0, 0), dtype=np.float32)
+
+    return names, matrix, offsets
+
+
+def json_fingerprint(json_path: str) -> np.ndarray:
+    """(size, mtime_ns) of a database JSON, stored in its .npz to spot a stale copy."""
+    st = os.stat(json_path)
+    return np.array([st.st_size, st.st_mtime_ns], dtype=np.int64)
+
+
+def save_database_npz(
+    data: Dict[str, List[List[float]]],
+    npz_path: str,
+    quantize: bool = False,
+    source_path: Optional[str] = None
+) -> None:
+    """
+    Write the stacked database next to its JSON for fast loading.
+
+    With quantize, rows are stored as int8 plus a float32 scale per row.
+    source_path is the JSON already written from data; its fingerprint is
+    stored so load_database only trusts the copy while that JSON is unchanged.
+    """
+    names, matrix, offsets = stack_database(data)
+    arrays = {"names": np.array(names, dtype=str), "offsets": offsets}
+    if source_path is not None:
+        arrays["source"] = json_fingerprint(source_path)
+
+    if quantize:
+        scale = np.max(np.abs(matrix), axis=1, initial=0.0) / 127
+        scale[scale == 0] = 1.0
+        arrays["matrix"] = np.round(matrix / scale[:, np.newaxis]).astype(np.int8)
+        arrays["scale"] = scale.astype(np.float32)
+    else:
+        arrays["matrix"] = matrix
+
+    # Write then rename, so a concurrent load never sees a partial file
+    # (the temp name keeps the .npz suffix, or savez would append one)
+    tmp_path = f"{npz_path}.{os.getpid()}.tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, npz_path)
+
+
+def load_database_npz(
+    npz_path: str,
+    source: Optional[np.ndarray] = None
+) -> Optional[Tuple[List[str], np.ndarray, np.ndarray]]:
+    """
+    Load a database written by save_database_npz (rows already normalized).
+
+    If source (a json_fingerprint) is given, returns None unless the file was
+    written from a JSON with that fingerprint.
+    """
+    with np.load(npz_path) as npz:
+        if source is not None and ("source" not in npz or not np.array_equal(npz["source"], source)):
+            return None
+        matrix = npz["matrix"]
+        if "scale" in npz:
+            # Dequantize once here: numpy has no int8 BLAS path, so comparing
+            # in float32 is faster than accumulating int8 products per query
+            matrix = matrix.astype(np.float32) * npz["scale"][:, np.newaxis]
+            matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-8
+        return npz["names"].tolist(), matrix, npz["offsets"]
+
+
+def load_database(database_path: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
     """
-    Load voiceprint database from JSON file.
+    Load voiceprint database.
+
+    Uses the sibling .npz (one contiguous read, no per-float parsing) when it
+    was written from this JSON as it is now (same size and mtime). Otherwise,
+    e.g. after a backup is restored over the JSON, parses and stacks the JSON
+    and rewrites the .npz from it.
 
     Args:
-        database_path: Path to database JSON file
+        database_path: Path to database JSON (or .npz) file
 
     Returns:
-        Dict mapping presenter names to lists of embeddings
+        Tuple of (names, matrix, offsets) as from stack_database
     """
     try:
+        npz_path = os.path.splitext(database_path)[0] + ".npz"
+        if database_path == npz_path:
+            return load_database_npz(npz_path)
+        source = json_fingerprint(database_path)
+        try:
+            database = load_database_npz(npz_path, source)
+        except Exception:
+            database = None  # Missing or unreadable copy
+        if database is not None:
+            return database
+
         with open(database_path) as f:
             data = json.load(f)
 
-        # Convert lists back to numpy arrays
-        database = {}
-        for name, embeddings in data.items():
-            database[name] = [np.array(emb, dtype=np.float32) for emb in embeddings]
+        try:
+            save_database_npz(data, npz_path, source_path=database_path)
+        except OSError:
+            pass  # Read-only location: keep parsing the JSON
 
-        return database
+        return stack_database(data)
 
     except Exception as e:
         raise RuntimeError(f"Failed to load database: {e}")
@@ -175,36 +384,43 @@ def load_database(database_path: str) -> Dict[str, List[np.ndarray]]:
 
 def compare_against_database(
     embedding: np.ndarray,
-    database: Dict[str, List[np.ndarray]]
+    database: Tuple[List[str], np.ndarray, np.ndarray]
 ) -> List[Dict[str, Any]]:
     """
     Compare embedding against voiceprint database.
 
     Args:
         embedding: Query embedding to compare
-        database: Database of reference embeddings
+        database: (names, matrix, offsets) from load_database
 
     Returns:
         List of matches sorted by similarity (best first)
     """
-    matches = []
-
-    for name, reference_embeddings in database.items():
-        # Compare against all reference embeddings for this presenter
-        similarities = [
-            cosine_similarity(embedding, ref_emb)
-            for ref_emb in reference_embeddings
-        ]
-
-        # Take the maximum similarity (best match)
-        best_similarity = max(similarities) if similarities else 0.0
-        avg_similarity = sum(similarities) / len(similarities) if similarities else 0.0
+    names, matrix, offsets = database
+    counts = np.diff(offsets)
+
+    best = np.zeros(len(names))
+    avg = np.zeros(len(names))
+    if len(matrix):
+        # Cosine similarity against every reference in one GEMV, clamped to [0, 1]
+        query = embedding.astype(np.float32)
+        query /= np.linalg.norm(query) + 1e-8
+        sims = np.clip(matrix @ query, 0.0, 1.0).astype(np.float64)
+
+        # Per-presenter max/mean over contiguous row groups (skipping empty ones,
+        # whose start offset would otherwise alias the next group)
+        has_refs = counts > 0
+        starts = offsets[:-1][has_refs]
+        best[has_refs] = np.maximum.reduceat(sims, starts)
+        avg[has_refs] = np.add.reduceat(sims, starts) / counts[has_refs]
 
+    matches = []
+    for i, name in enumerate(names):
         matches.append({
             "name": name,
-            "similarity": round(best_similarity, 4),
-            "avg_similarity": round(avg_similarity, 4),
-            "num_references": len(similarities)
+            "similarity": round(float(best[i]), 4),
+            "avg_similarity": round(float(avg[i]), 4),
+            "num_references": int(counts[i])
         })
 
     # Sort by similarity (descending)
@@ -217,98 +433,284 @@ def compare_against_database(
     return matches
 
 
-def cmd_extract(args):
-    """Extract embedding from audio file."""
-    inference, device = setup_model()
+def embedding_fields(embedding: np.ndarray, legacy_json: bool = False) -> Dict[str, Any]:
+    """
+    Encode an embedding for JSON output as base64 of its float32 bytes.
+
+    About a quarter the size of a float list and decoded with one
+    np.frombuffer; legacy_json also includes the plain "embedding" list.
+    """
+    fields = {
+        "embedding_b64": base64.b64encode(embedding.astype(np.float32).tobytes()).decode("ascii"),
+        "dtype": "float32",
+    }
+    if legacy_json:
+        fields["embedding"] = embedding.tolist()
+    return fields
 
-    try:
-        embedding = extract_embedding(args.audio_file, inference)
 
-        # Output JSON
-        result = {
-            "embedding": embedding.tolist(),
-            "dimension": len(embedding),
-            "audio_file": args.audio_file
-        }
+def decode_embedding(result: Dict[str, Any]) -> np.ndarray:
+    """Read the embedding from an extract/compare/batch result (either encoding)."""
+    if "embedding_b64" in result:
+        return np.frombuffer(base64.b64decode(result["embedding_b64"]), dtype=result.get("dtype", "float32"))
+    return np.asarray(result["embedding"], dtype=np.float32)
 
-        print(json.dumps(result))
 
+def extract_result(audio_file: str, inference, legacy_json: bool = False) -> Dict[str, Any]:
+    """Build the extract command's output for one audio file."""
+    embedding = extract_embedding(audio_file, inference)
+    return {
+        **embedding_fields(embedding, legacy_json),
+        "dimension": len(embedding),
+        "audio_file": audio_file
+    }
+
+
+def compare_result(audio_file: str, database_path: str, inference, legacy_json: bool = False) -> Dict[str, Any]:
+    """Build the compare command's output for one audio file."""
+    # Extract embedding
+    embedding = extract_embedding(audio_file, inference)
+
+    # Load database
+    database = load_database(database_path)
+
+    # Compare
+    matches = compare_against_database(embedding, database)
+
+    return {
+        "audio_file": audio_file,
+        **embedding_fields(embedding, legacy_json),
+        "matches": matches
+    }
+
+
+def handle_request(request: Dict[str, Any], inference) -> Dict[str, Any]:
+    """Run one worker request ({"cmd": "extract"|"compare", ...})."""
+    try:
+        legacy_json = request.get("legacy_json", False)
+        if request.get("cmd") == "extract":
+            return extract_result(request["audio_file"], inference, legacy_json)
+        if request.get("cmd") == "compare":
+            return compare_result(request["audio_file"], request["database"], inference, legacy_json)
+        return {"error": f"Unknown command: {request.get('cmd')}"}
     except Exception as e:
-        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        return {"error": str(e)}
+
+
+def request_worker(request: Dict[str, Any], socket_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Send a request to a running worker (one JSON line each way).
+
+    Returns:
+        The worker's response, or None if no worker is listening
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+def run_command(request: Dict[str, Any], args, fallback) -> Dict[str, Any]:
+    """Get a worker's response, or run fallback(inference) in-process if none is up."""
+    result = request_worker(request, args.socket)
+
+    if result is None:
+        inference, device = setup_model(args.threads)
+        try:
+            result = fallback(inference)
+        except Exception as e:
+            result = {"error": str(e)}
+
+    if "error" in result:
+        print(json.dumps({"error": result["error"]}), file=sys.stderr)
         sys.exit(1)
 
+    return result
+
+
+def cmd_extract(args):
+    """Extract embedding from audio file."""
+    request = {
+        "cmd": "extract",
+        "audio_file": os.path.abspath(args.audio_file),
+        "legacy_json": args.legacy_json,
+    }
+
+    def fallback(inference):
+        return extract_result(args.audio_file, inference, args.legacy_json)
+
+    result = run_command(request, args, fallback)
+    result["audio_file"] = args.audio_file  # the worker saw the absolute path
+    print(json.dumps(result))
+
 
 def cmd_compare(args):
     """Compare audio file against database."""
-    inference, device = setup_model()
-
-    try:
-        # Extract embedding
-        embedding = extract_embedding(args.audio_file, inference)
+    request = {
+        "cmd": "compare",
+        "audio_file": os.path.abspath(args.audio_file),
+        "database": os.path.abspath(args.database),
+        "legacy_json": args.legacy_json,
+    }
 
-        # Load database
-        database = load_database(args.database)
+    def fallback(inference):
+        return compare_result(args.audio_file, args.database, inference, args.legacy_json)
 
-        # Compare
-        matches = compare_against_database(embedding, database)
+    result = run_command(request, args, fallback)
+    result["audio_file"] = args.audio_file  # the worker saw the absolute path
+    print(json.dumps(result))
 
-        # Output JSON
-        result = {
-            "audio_file": args.audio_file,
-            "embedding": embedding.tolist(),
-            "matches": matches
-        }
 
-        print(json.dumps(result))
+def cmd_serve(args):
+    """Load the model once and answer extract/compare requests on a Unix socket."""
+    inference, device = setup_model(args.threads)
 
-    except Exception as e:
-        print(json.dumps({"error": str(e)}), file=sys.stderr)
-        sys.exit(1)
+    # Clear a socket left behind by a previous worker
+    try:
+        os.unlink(args.socket)
+    except FileNotFoundError:
+        pass
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(args.socket)
+        os.chmod(args.socket, 0o600)  # requests read arbitrary paths as this user
+        server.listen()
+        print(f"Serving on {args.socket} ({device})", file=sys.stderr)
+
+        # One request at a time: they all share the same model/GPU
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rwb") as f:
+                line = f.readline()
+                if not line:
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    response = {"error": f"Invalid request: {e}"}
+                else:
+                    response = handle_request(request, inference)
+                f.write(json.dumps(response).encode() + b"\n")
+                f.flush()
 
 
 def cmd_batch(args):
     """Batch process files for database building."""
-    inference, device = setup_model()
+    inference, device = setup_model(args.threads)
 
     try:
         # Read file list
         with open(args.file_list) as f:
             files = [line.strip() for line in f if line.strip()]
 
-        results = {}
-
-        for i, audio_file in enumerate(files, 1):
-            print(f"[{i}/{len(files)}] Processing: {audio_file}", file=sys.stderr)
-
-            try:
-                embedding = extract_embedding(audio_file, inference)
-                results[audio_file] = {
-                    "embedding": embedding.tolist(),
-                    "dimension": len(embedding)
-                }
-            except Exception as e:
-                print(f"  Error: {e}", file=sys.stderr)
-                results[audio_file] = {"error": str(e)}
-
-        # Save results
         output_path = Path(args.output_file)
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
-
-        print(f"Saved {len(results)} results to {output_path}", file=sys.stderr)
+        saved = 0
+        model_rate = getattr(getattr(inference.model, "audio", None), "sample_rate", None)
+        starts = range(0, len(files), args.batch_size)
+
+        # Decode the next chunk in background threads while the current one
+        # is on the model, so disk I/O overlaps inference
+        with open(output_path, "w") as out, ThreadPoolExecutor(max_workers=4) as loader:
+            def prefetch(start):
+                return [(f, loader.submit(load_waveform, f)) for f in files[start:start + args.batch_size]]
+
+            pending = prefetch(0) if files else []
+            for start in starts:
+                chunk_loads = pending
+                if start + args.batch_size < len(files):
+                    pending = prefetch(start + args.batch_size)
+
+                chunk = [audio_file for audio_file, _ in chunk_loads]
+                loaded = {}
+                chunk_results = {}
+
+                for i, (audio_file, future) in enumerate(chunk_loads, start + 1):
+                    print(f"[{i}/{len(files)}] Processing: {audio_file}", file=sys.stderr)
+                    try:
+                        loaded[audio_file] = future.result()
+                    except Exception as e:
+                        print(f"  Error: Failed to extract embedding: {e}", file=sys.stderr)
+                        chunk_results[audio_file] = {"error": f"Failed to extract embedding: {e}"}
+
+                # Mono clips of equal length at the model's rate share one forward
+                # pass; anything else goes through the per-file Inference call
+                groups = defaultdict(list)
+                for audio_file, (waveform, sample_rate) in loaded.items():
+                    if sample_rate == model_rate and waveform.shape[0] == 1:
+                        groups[waveform.shape].append(audio_file)
+                    else:
+                        groups[audio_file].append(audio_file)
+
+                for group in groups.values():
+                    embeddings = None
+                    if len(group) > 1:
+                        try:
+                            embeddings = embed_waveform_batch([loaded[f][0] for f in group], inference)
+                        except Exception as e:
+                            print(f"  Batch of {len(group)} failed ({e}), retrying per file", file=sys.stderr)
+
+                    for j, audio_file in enumerate(group):
+                        try:
+                            if embeddings is not None:
+                                embedding = embeddings[j]
+                            else:
+                                embedding = embed_waveform(*loaded[audio_file], inference)
+                            chunk_results[audio_file] = {
+                                **embedding_fields(embedding, args.legacy_json),
+                                "dimension": len(embedding)
+                            }
+                        except Exception as e:
+                            print(f"  Error: {audio_file}: {e}", file=sys.stderr)
+                            chunk_results[audio_file] = {"error": f"Failed to extract embedding: {e}"}
+
+                # Stream results in file-list order, so memory stays flat and
+                # an interrupted run keeps everything finished so far
+                for audio_file in chunk:
+                    out.write(json.dumps({"file": audio_file, **chunk_results[audio_file]}) + "\n")
+                out.flush()
+                saved += len(chunk)
+
+        print(f"Saved {saved} results to {output_path}", file=sys.stderr)
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
         sys.exit(1)
 
 
+def iter_batch_results(path: str):
+    """
+    Yield (audio_file, result) from a batch output file.
+
+    Reads the NDJSON written by cmd_batch line by line; older batch output
+    (one JSON object keyed by file) is loaded whole.
+    """
+    with open(path) as f:
+        first = f.readline()
+        try:
+            record = json.loads(first)
+        except ValueError:
+            record = None
+
+        if not (isinstance(record, dict) and "file" in record):
+            f.seek(0)
+            yield from json.load(f).items()
+            return
+
+        yield record.pop("file"), record
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record.pop("file"), record
+
+
 def cmd_build_database(args):
     """Build database from embeddings JSON."""
     try:
-        # Load embeddings file (output from batch command)
-        with open(args.embeddings_file) as f:
-            embeddings_data = json.load(f)
-
         # Load labels file (mapping files to presenters)
         with open(args.labels_file) as f:
             labels_data = json.load(f)
@@ -316,7 +718,8 @@ def cmd_build_database(args):
         # Build database by grouping embeddings by presenter
         database = {}
 
-        for file_path, emb_data in embeddings_data.items():
+        # Stream embeddings file (output from batch command)
+        for file_path, emb_data in iter_batch_results(args.embeddings_file):
             if "error" in emb_data:
                 continue
 
@@ -334,12 +737,14 @@ def cmd_build_database(args):
             if presenter not in database:
                 database[presenter] = []
 
-            database[presenter].append(emb_data["embedding"])
+            database[presenter].append(decode_embedding(emb_data).tolist())
 
         # Save database
         output_path = Path(args.output)
         with open(output_path, "w") as f:
             json.dump(database, f, indent=2)
+        save_database_npz(database, str(output_path.with_suffix(".npz")), quantize=args.int8,
+                          source_path=str(output_path))
 
         # Print summary
         print(f"Built database with {len(database)} presenters:", file=sys.stderr)
@@ -360,6 +765,13 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
+    parser.add_argument('--socket', default=DEFAULT_SOCKET,
+                        help=f'Worker socket used by serve/extract/compare (default: {DEFAULT_SOCKET})')
+    parser.add_argument('--legacy-json', action='store_true',
+                        help='Also output embeddings as a plain "embedding" float list')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                        help=f'CPU threads for torch, 0 for library default (default: {DEFAULT_THREADS})')
+
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
     # Extract command
@@ -377,22 +789,32 @@ def main():
     parser_compare.add_argument('audio_file', help='Path to audio file')
     parser_compare.add_argument('database', help='Path to database JSON file')
 
+    # Serve command
+    subparsers.add_parser(
+        'serve',
+        help='Keep the model loaded and answer extract/compare over --socket'
+    )
+
     # Batch command
     parser_batch = subparsers.add_parser(
         'batch',
         help='Batch process audio files for database building'
     )
     parser_batch.add_argument('file_list', help='Text file with list of audio files (one per line)')
-    parser_batch.add_argument('output_file', help='Output JSON file for embeddings')
+    parser_batch.add_argument('output_file', help='Output NDJSON file for embeddings (one result per line)')
+    parser_batch.add_argument('--batch-size', type=int, default=32,
+                              help='Files per forward pass when clips share a shape (default: 32)')
 
     # Build database command
     parser_build = subparsers.add_parser(
         'build-database',
         help='Build database from embeddings and labels'
     )
-    parser_build.add_argument('embeddings_file', help='JSON file from batch command')
+    parser_build.add_argument('embeddings_file', help='NDJSON (or older JSON) file from batch command')
     parser_build.add_argument('labels_file', help='JSON file from analyze_archive.py')
     parser_build.add_argument('--output', default='database.json', help='Output database file')
+    parser_build.add_argument('--int8', action='store_true',
+                              help='Store the .npz copy as int8 (4x smaller, ~0.001 similarity error)')
 
     args = parser.parse_args()
 
@@ -404,6 +826,7 @@ def main():
     commands = {
         'extract': cmd_extract,
         'compare': cmd_compare,
+        'serve': cmd_serve,
         'batch': cmd_batch,
         'build-database': cmd_build_database,
     }
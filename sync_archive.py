@@ -6,31 +6,48 @@ Checks destinations before copying/uploading to avoid duplicates.
 Does not re-process files - uploads as-is.
 """
 
+import fcntl
 import os
 import re
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Configuration
 LOCAL_DIR = "/home/pi/share/198k"
 RACK_BASE = "/mnt/rack-shipping"
+SYNC_WORKERS = 8  # Concurrent IA existence checks / Rack copies
+
+COPY_BUFFER_SIZE = 8 * 1024 * 1024  # Userspace fallback copy chunk
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)  # fcntl.FICLONE is Python 3.12+
+
+# ShippingFCST-YYMMDD_ with an optional AM_/PM_HHMM time part
+FILENAME_RE = re.compile(r'ShippingFCST-(\d{2})(\d{2})(\d{2})_(?:[AP]M_(\d{2})(\d{2}))?')
+
+_thread_local = threading.local()
+
+# Filenames already on Rack, listed once per YYYY/MM directory
+_rack_index = {}
+_rack_index_lock = threading.Lock()
 
 
 def extract_date_from_filename(filename: str) -> tuple:
     """Extract year, month, day from filename like ShippingFCST-YYMMDD_..."""
-    match = re.search(r'ShippingFCST-(\d{2})(\d{2})(\d{2})_', filename)
+    match = FILENAME_RE.match(os.path.basename(filename))
     if match:
-        yy, mm, dd = match.groups()
+        yy, mm, dd = match.group(1, 2, 3)
         return f"20{yy}", mm, dd
     return None, None, None
 
 
 def extract_datetime_for_ia(filename: str) -> tuple:
     """Extract date and time for IA identifier from filename."""
-    match = re.search(r'ShippingFCST-(\d{2})(\d{2})(\d{2})_[AP]M_(\d{2})(\d{2})', filename)
-    if match:
+    match = FILENAME_RE.match(os.path.basename(filename))
+    if match and match.group(4):
         yy, mm, dd, hh, mi = match.groups()
         year = f"20{yy}"
         date_str = f"{year}-{mm}-{dd}"
@@ -40,59 +57,117 @@ def extract_datetime_for_ia(filename: str) -> tuple:
     return None, None, None
 
 
+def rack_listing(year: str, month: str) -> set:
+    """Return the set of filenames in a Rack YYYY/MM directory, listed on first use."""
+    with _rack_index_lock:
+        names = _rack_index.get((year, month))
+        if names is None:
+            try:
+                names = set(os.listdir(Path(RACK_BASE) / year / month))
+            except FileNotFoundError:
+                names = set()
+            _rack_index[(year, month)] = names
+        return names
+
+
 def check_rack_exists(filename: str) -> bool:
     """Check if file already exists on Rack."""
     year, month, _ = extract_date_from_filename(filename)
     if not year:
         return False
-    rack_path = Path(RACK_BASE) / year / month / filename
-    return rack_path.exists()
+    return filename in rack_listing(year, month)
 
 
-def check_ia_exists(identifier: str) -> bool:
-    """Check if item already exists on Internet Archive."""
-    try:
+def ia_session():
+    """Return this thread's Internet Archive session (requests sessions aren't thread-safe)."""
+    session = getattr(_thread_local, "ia_session", None)
+    if session is None:
         import internetarchive as ia
-        item = ia.get_item(identifier)
-        return item.exists
-    except Exception as e:
-        print(f"  Warning: Could not check IA for {identifier}: {e}")
-        return False
+        session = _thread_local.ia_session = ia.get_session()
+    return session
 
 
-def backup_to_rack(src_path: str, dry_run: bool = False) -> bool:
+def check_ia_exists(identifier: str, log=print) -> Optional[bool]:
+    """Check if item already exists on Internet Archive (None if the check failed)."""
+    try:
+        item = ia_session().get_item(identifier)
+        return item.exists
+    except Exception as e:
+        log(f"  Warning: Could not check IA for {identifier}: {e}")
+        return None
+
+
+def fast_copy(src_path, dst_path) -> None:
+    """Copy file contents: reflink if supported, else in-kernel copy_file_range, else buffered copy."""
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return
+        except OSError:
+            pass
+
+        # os.copy_file_range is Linux-only
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+            except OSError:
+                pass
+
+        # Start over with a plain copy (e.g. network mounts without copy_file_range)
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
+def backup_to_rack(src_path: str, dry_run: bool = False, log=print) -> bool:
     """Copy file to Rack with YYYY/MM structure."""
     filename = os.path.basename(src_path)
     year, month, _ = extract_date_from_filename(filename)
 
     if not year:
-        print(f"  Skipping {filename} - cannot extract date")
+        log(f"  Skipping {filename} - cannot extract date")
         return False
 
     target_dir = Path(RACK_BASE) / year / month
     target_path = target_dir / filename
 
-    if target_path.exists():
-        print(f"  Already on Rack: {filename}")
+    listing = rack_listing(year, month)
+    if filename in listing:
+        log(f"  Already on Rack: {filename}")
         return True
 
     if dry_run:
-        print(f"  Would copy to: {target_path}")
+        log(f"  Would copy to: {target_path}")
         return True
 
     target_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src_path, target_path)
+    fast_copy(src_path, target_path)
+    shutil.copystat(src_path, target_path)
 
     if target_path.exists():
-        print(f"  Backed up: {filename}")
+        with _rack_index_lock:
+            listing.add(filename)
+        log(f"  Backed up: {filename}")
         return True
     else:
-        print(f"  FAILED: {filename}")
+        log(f"  FAILED: {filename}")
         return False
 
 
-def upload_to_ia(mp3_path: str, dry_run: bool = False) -> bool:
-    """Upload file to Internet Archive."""
+def upload_to_ia(mp3_path: str, dry_run: bool = False, already_exists: Optional[bool] = None) -> bool:
+    """Upload file to Internet Archive.
+
+    Pass already_exists from a prior check_ia_exists() that succeeded to skip
+    the existence lookup; None (including a failed check) looks it up here.
+    """
     try:
         import internetarchive as ia
     except ImportError:
@@ -107,13 +182,16 @@ def upload_to_ia(mp3_path: str, dry_run: bool = False) -> bool:
         return False
 
     # Check if already exists
-    try:
-        item = ia.get_item(identifier)
-        if item.exists:
-            print(f"  Already on IA: {identifier}")
-            return True
-    except Exception as e:
-        print(f"  Warning checking IA: {e}")
+    if already_exists is None:
+        try:
+            already_exists = ia.get_item(identifier).exists
+        except Exception as e:
+            # Don't risk a duplicate upload when existence is unknown
+            print(f"  IA check failed: {e}")
+            return False
+    if already_exists:
+        print(f"  Already on IA: {identifier}")
+        return True
 
     if dry_run:
         print(f"  Would upload as: {identifier}")
@@ -186,40 +264,65 @@ def main():
     ia_success = 0
     ia_skip = 0
 
-    # Process each MP3 file
-    for mp3_path in mp3_files:
-        print(f"\n{mp3_path.name}")
-
-        # Find corresponding WAV
-        wav_path = str(mp3_path).replace('.mp3', '.wav')
+    # IA checks and Rack copies run on the pool, each logging into its own
+    # list; the loop below prints them under each file's name, in order
+    def submit(fn, *fn_args):
+        lines = []
+        return pool.submit(fn, *fn_args, log=lines.append), lines
+
+    def result(job):
+        future, lines = job
+        value = future.result()
+        for line in lines:
+            print(line)
+        return value
+
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+        ia_checks = {}
+        if not args.rack_only:
+            for mp3_path in mp3_files:
+                identifier, _, _ = extract_datetime_for_ia(mp3_path.name)
+                if identifier:
+                    ia_checks[mp3_path] = (identifier, submit(check_ia_exists, identifier))
 
-        # Backup to Rack
+        rack_jobs = {}
         if not args.ia_only:
-            # Backup MP3
-            if backup_to_rack(str(mp3_path), args.dry_run):
-                if check_rack_exists(mp3_path.name):
-                    rack_skip += 1
-                else:
-                    rack_success += 1
-
-            # Backup WAV if exists
-            if os.path.exists(wav_path):
-                backup_to_rack(wav_path, args.dry_run)
-
-        # Upload to IA
-        if not args.rack_only:
-            identifier, _, _ = extract_datetime_for_ia(mp3_path.name)
-            if identifier:
-                try:
-                    import internetarchive as ia
-                    item = ia.get_item(identifier)
-                    if item.exists:
-                        print(f"  Already on IA: {identifier}")
-                        ia_skip += 1
-                    elif upload_to_ia(str(mp3_path), args.dry_run):
-                        ia_success += 1
-                except Exception as e:
-                    print(f"  IA check failed: {e}")
+            for mp3_path in mp3_files:
+                existed = check_rack_exists(mp3_path.name)
+                mp3_job = submit(backup_to_rack, str(mp3_path), args.dry_run)
+
+                # Backup WAV if exists
+                wav_job = None
+                wav_path = str(mp3_path).replace('.mp3', '.wav')
+                if os.path.exists(wav_path):
+                    wav_job = submit(backup_to_rack, wav_path, args.dry_run)
+                rack_jobs[mp3_path] = (existed, mp3_job, wav_job)
+
+        for mp3_path in mp3_files:
+            print(f"\n{mp3_path.name}")
+
+            # Backup to Rack
+            if mp3_path in rack_jobs:
+                existed, mp3_job, wav_job = rack_jobs[mp3_path]
+                if result(mp3_job):
+                    if existed:
+                        rack_skip += 1
+                    else:
+                        rack_success += 1
+                if wav_job is not None:
+                    result(wav_job)
+
+            # Upload to IA
+            if mp3_path in ia_checks:
+                identifier, check_job = ia_checks[mp3_path]
+                exists = result(check_job)
+                if exists is None:
+                    print(f"  IA check failed: {identifier}")
+                elif exists:
+                    print(f"  Already on IA: {identifier}")
+                    ia_skip += 1
+                elif upload_to_ia(str(mp3_path), args.dry_run, already_exists=exists):
+                    ia_success += 1
 
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -8,17 +8,33 @@ import numpy as np
 from scipy import signal
 import sys
 
+from kiwi_recorder import Config
+
+# Coarse search runs on audio decimated by the same factor as the recorder,
+# then the peak is refined at the full sample rate
+DECIMATION = max(1, Config.ANTHEM_DECIMATION)
+
 
 def load_wav(path: str) -> tuple[np.ndarray, int]:
     """Load WAV file and return samples and sample rate"""
     with wave.open(path, 'r') as wav:
         frames = wav.readframes(wav.getnframes())
         sample_rate = wav.getframerate()
-        samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+        samples = np.frombuffer(frames, dtype=np.int16)
     return samples, sample_rate
 
 
-def detect_anthem_with_template(recording_path: str, template_path: str, start_search_time: float = 600) -> tuple[float, float] | None:
+def normalize(samples: np.ndarray) -> np.ndarray:
+    """Return zero-mean, unit-variance float32 copy of int16 samples in one pass"""
+    mean = np.mean(samples, dtype=np.float64)
+    std = np.std(samples, dtype=np.float64)
+    out = np.empty(len(samples), dtype=np.float32)
+    np.subtract(samples, mean, out=out, dtype=np.float32)
+    out *= np.float32(1.0 / std)
+    return out
+
+
+def detect_anthem_with_template(recording_path: str, template_path: str, start_search_time: float = 600, verbose: bool = False) -> tuple[float, float] | None:
     """
     Detect anthem in recording using cross-correlation with template
 
@@ -26,6 +42,7 @@ def detect_anthem_with_template(recording_path: str, template_path: str, start_s
         recording_path: Path to full recording
         template_path: Path to anthem template (drumroll + opening)
         start_search_time: Start searching from this time in seconds (default 10 minutes)
+        verbose: Print correlation values around the peak
 
     Returns:
         Tuple of (time_in_seconds, correlation_score) or None
@@ -51,16 +68,33 @@ def detect_anthem_with_template(recording_path: str, template_path: str, start_s
     print(f"  Search region: {len(search_region)} samples, {len(search_region)/rec_rate:.2f}s")
 
     # Normalize both signals
-    template_norm = (template - np.mean(template)) / np.std(template)
-    search_norm = (search_region - np.mean(search_region)) / np.std(search_region)
+    template_norm = normalize(template)
+    search_norm = normalize(search_region)
 
-    # Compute cross-correlation
+    # Compute cross-correlation: coarse pass on decimated signals. Valid-mode
+    # correlation is convolution with the reversed template; overlap-add keeps
+    # the FFT blocks sized to the template instead of the whole recording
     print("\nComputing cross-correlation...")
-    correlation = signal.correlate(search_norm, template_norm, mode='valid')
+    search_ds, template_ds = search_norm, template_norm
+    if DECIMATION > 1:
+        search_ds = signal.decimate(search_norm, DECIMATION, ftype='fir').astype(np.float32)
+        template_ds = signal.decimate(template_norm, DECIMATION, ftype='fir').astype(np.float32)
+    coarse = signal.oaconvolve(search_ds, template_ds[::-1], mode='valid')
+    coarse_idx = int(np.argmax(coarse)) * DECIMATION
+
+    # Fine pass: full-rate correlation around the coarse peak, wide enough to
+    # also cover the context printed below
+    context_window = 50
+    reach = 2 * DECIMATION + context_window
+    lo = max(0, coarse_idx - reach)
+    hi = min(len(search_norm) - len(template_norm) + 1, coarse_idx + reach + 1)
+    correlation = signal.correlate(search_norm[lo:hi + len(template_norm) - 1], template_norm, mode='valid')
 
-    # Find peak
-    peak_idx = np.argmax(correlation)
-    peak_value = correlation[peak_idx]
+    # Find peak (within the coarse estimate's uncertainty)
+    peak_lo = max(lo, coarse_idx - 2 * DECIMATION) - lo
+    peak_hi = min(hi, coarse_idx + 2 * DECIMATION + 1) - lo
+    peak_idx = lo + peak_lo + int(np.argmax(correlation[peak_lo:peak_hi]))
+    peak_value = correlation[peak_idx - lo]
 
     # Convert to time in original recording
     detection_sample = start_sample + peak_idx
@@ -73,32 +107,34 @@ def detect_anthem_with_template(recording_path: str, template_path: str, start_s
     print(f"Detected at: {int(detection_time // 60)}:{int(detection_time % 60):02d} ({detection_time:.2f}s)")
     print(f"Sample index: {detection_sample}")
 
-    # Show some context around the peak
-    context_window = 50
-    start_ctx = max(0, peak_idx - context_window)
-    end_ctx = min(len(correlation), peak_idx + context_window)
-    context = correlation[start_ctx:end_ctx]
-
-    print(f"\nCorrelation values around peak:")
-    for i, val in enumerate(context[::10]):  # Show every 10th value
-        actual_idx = start_ctx + i * 10
-        time_offset = actual_idx / rec_rate
-        actual_time = start_search_time + time_offset
-        marker = " <-- PEAK" if (start_ctx + i * 10) == peak_idx else ""
-        print(f"  {int(actual_time // 60)}:{int(actual_time % 60):02d} - {val:.2f}{marker}")
+    if verbose:
+        # Show every 10th correlation value around the peak
+        start_ctx = max(lo, peak_idx - context_window)
+        end_ctx = min(hi, peak_idx + context_window)
+        indices = np.arange(start_ctx, end_ctx, 10)
+        values = correlation[indices - lo]
+        times = start_search_time + indices / rec_rate
+
+        lines = [
+            f"  {int(t // 60)}:{int(t % 60):02d} - {v:.2f}{' <-- PEAK' if i == peak_idx else ''}"
+            for i, t, v in zip(indices.tolist(), times.tolist(), values.tolist())
+        ]
+        sys.stdout.write("\nCorrelation values around peak:\n" + "\n".join(lines) + "\n")
 
     return detection_time, peak_value
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 test_anthem_detection.py <recording.wav> [template.wav]")
+    verbose = "--verbose" in sys.argv[1:]
+    args = [a for a in sys.argv[1:] if a != "--verbose"]
+    if len(args) < 1:
+        print("Usage: python3 test_anthem_detection.py [--verbose] <recording.wav> [template.wav]")
         sys.exit(1)
 
-    recording = sys.argv[1]
-    template = sys.argv[2] if len(sys.argv) > 2 else "/home/pi/share/198k/anthem_template.wav"
+    recording = args[0]
+    template = args[1] if len(args) > 1 else "/home/pi/share/198k/anthem_template.wav"
 
-    result = detect_anthem_with_template(recording, template)
+    result = detect_anthem_with_template(recording, template, verbose=verbose)
 
     if result:
         time, score = result
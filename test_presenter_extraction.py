@@ -3,6 +3,7 @@
 
 import re
 import json
+import sys
 from pathlib import Path
 from difflib import SequenceMatcher
 
@@ -87,14 +88,19 @@ def detect_presenter(transcript: str, known_presenters: list[dict] = None) -> di
     if known_presenters is None:
         known_presenters = load_presenters()
 
-    candidates = extract_name_candidates(transcript)
+    return resolve_candidates(
+        extract_name_candidates(transcript),
+        lambda candidate: fuzzy_match(candidate, known_presenters)
+    )
 
+def resolve_candidates(candidates: list[str], match_candidate) -> dict:
+    """Build the detect_presenter result from extracted candidates, matching each via match_candidate."""
     if not candidates:
         return {"presenter": None, "raw_match": None, "confidence": 0.0, "match_type": "no_match"}
 
     # Try each candidate
     for candidate in candidates:
-        match = fuzzy_match(candidate, known_presenters)
+        match = match_candidate(candidate)
         if match:
             return {
                 "presenter": match["name"],
@@ -150,13 +156,23 @@ TEST_CASES = [
 def run_tests():
     """Run all test cases and report results."""
     presenters = load_presenters()
-    print(f"Loaded {len(presenters)} known presenters\n")
+
+    # Collect the report and write it once at the end
+    lines = []
+    out = lines.append
+    out(f"Loaded {len(presenters)} known presenters\n")
 
     passed = 0
     failed = 0
 
-    for transcript, expected in TEST_CASES:
-        result = detect_presenter(transcript, presenters)
+    # Extract every case's candidates first, then fuzzy-match each distinct
+    # candidate once (many cases share names)
+    case_candidates = [extract_name_candidates(transcript) for transcript, _ in TEST_CASES]
+    unique = {c for candidates in case_candidates for c in candidates}
+    matches = {c: fuzzy_match(c, presenters) for c in unique}
+
+    for (transcript, expected), candidates in zip(TEST_CASES, case_candidates):
+        result = resolve_candidates(candidates, matches.get)
         actual = result["presenter"]
 
         if actual == expected:
@@ -166,13 +182,14 @@ def run_tests():
             status = "FAIL"
             failed += 1
 
-        print(f"[{status}] '{transcript[:50]}...' if len(transcript) > 50 else '{transcript}'")
-        print(f"       Expected: {expected}")
-        print(f"       Got: {actual} (raw: {result['raw_match']}, conf: {result['confidence']:.2f}, type: {result['match_type']})")
-        print()
+        out(f"[{status}] '{transcript[:50]}...' if len(transcript) > 50 else '{transcript}'")
+        out(f"       Expected: {expected}")
+        out(f"       Got: {actual} (raw: {result['raw_match']}, conf: {result['confidence']:.2f}, type: {result['match_type']})")
+        out("")
 
-    print(f"\n{'='*50}")
-    print(f"Results: {passed}/{passed+failed} passed ({100*passed/(passed+failed):.0f}%)")
+    out(f"\n{'='*50}")
+    out(f"Results: {passed}/{passed+failed} passed ({100*passed/(passed+failed):.0f}%)")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return failed == 0
 
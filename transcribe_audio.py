@@ -1,15 +1,70 @@
 #!/usr/bin/env python3
 """Simple Whisper transcription script for Shipping Forecast presenter detection."""
 
+import functools
+import os
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 from faster_whisper import WhisperModel
+from faster_whisper.audio import decode_audio
 
-def transcribe(audio_path: str, model_size: str = "base") -> dict:
-    """Transcribe audio file and return result."""
-    model = WhisperModel(model_size, device="cpu", compute_type="int8")
+# Transcribe only the last N seconds (0 = whole file). kiwi_recorder already
+# sends a 45s segment cut to end just before the fade, and names are found
+# throughout it, so this is off by default
+TAIL_SECONDS = float(os.environ.get("WHISPER_TAIL_SECONDS", "0"))
+SAMPLE_RATE = 16000  # what Whisper decodes audio to
+
+# ctranslate2 threads per model; --batch splits the cores between workers
+CPU_THREADS = int(os.environ.get("WHISPER_CPU_THREADS", "0")) or os.cpu_count() or 0
+BATCH_THREADS = 4  # per --batch worker: past this, encoder threading scales poorly
+
+def pick_device() -> tuple:
+    """Return (device, compute_type): CUDA with int8_float16 if available, else CPU int8.
+
+    WHISPER_DEVICE=cpu|cuda overrides the detection.
+    """
+    device = os.environ.get("WHISPER_DEVICE", "auto")
+    if device == "auto":
+        try:
+            import ctranslate2
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except Exception:
+            device = "cpu"
+    compute_type = "int8_float16" if device == "cuda" else "int8"
+    return device, compute_type
+
+@functools.lru_cache(maxsize=4)
+def get_model(model_size: str, device: str = "cpu", compute_type: str = "int8") -> WhisperModel:
+    """Load a WhisperModel once per configuration; later calls reuse it."""
+    # ctranslate2's default CPU thread count leaves cores idle on the Rack box
+    cpu_threads = CPU_THREADS if device == "cpu" else 0
+    return WhisperModel(model_size, device=device, compute_type=compute_type,
+                        cpu_threads=cpu_threads, num_workers=1)
+
+def transcribe(audio_path: str, model_size: str = "base",
+               tail_seconds: float = TAIL_SECONDS) -> dict:
+    """
+    Transcribe audio file and return result.
+
+    tail_seconds > 0 only feeds the end of the file to the model.
+    """
+    model = get_model(model_size, *pick_device())
+
+    audio = audio_path
+    if tail_seconds > 0:
+        audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)[-int(tail_seconds * SAMPLE_RATE):]
     
-    segments, info = model.transcribe(audio_path, beam_size=5)
+    # Greedy decoding is enough to catch a short sign-off name; VAD skips
+    # silent stretches before they reach the decoder
+    segments, info = model.transcribe(
+        audio,
+        beam_size=1,
+        best_of=1,
+        temperature=0.0,
+        vad_filter=True,
+        condition_on_previous_text=False,
+    )
     
     # Collect all text
     text_parts = []
@@ -25,13 +80,74 @@ def transcribe(audio_path: str, model_size: str = "base") -> dict:
         "duration": info.duration
     }
 
+def serve(model_size: str) -> None:
+    """Read audio paths from stdin, one per line, printing one JSON result per line."""
+    for line in sys.stdin:
+        audio_file = line.strip()
+        if not audio_file:
+            continue
+        try:
+            result = transcribe(audio_file, model_size)
+        except Exception as e:
+            result = {"error": str(e)}
+        print(json.dumps(result), flush=True)
+
+def _init_worker(model_size: str, cpu_threads: int) -> None:
+    """ProcessPoolExecutor initializer: load this worker's model up front."""
+    global CPU_THREADS
+    CPU_THREADS = cpu_threads
+    get_model(model_size, *pick_device())
+
+def _transcribe_file(model_size: str, audio_file: str) -> dict:
+    try:
+        result = transcribe(audio_file, model_size)
+    except Exception as e:
+        result = {"error": str(e)}
+    return {"file": audio_file, **result}
+
+def batch(model_size: str, audio_files: list) -> None:
+    """
+    Transcribe several files, printing one JSON result per line in input order.
+
+    On CPU the files are spread over processes of BATCH_THREADS threads each,
+    since one model doesn't keep every core busy through the decoder; on CUDA
+    they share one model in this process.
+    """
+    workers = 1
+    if pick_device()[0] == "cpu":
+        workers = max(1, min(len(audio_files), (os.cpu_count() or 1) // BATCH_THREADS))
+
+    if workers == 1:
+        for audio_file in audio_files:
+            print(json.dumps(_transcribe_file(model_size, audio_file)), flush=True)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(model_size, BATCH_THREADS)) as pool:
+        for result in pool.map(functools.partial(_transcribe_file, model_size), audio_files):
+            print(json.dumps(result), flush=True)
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(json.dumps({"error": "Usage: transcribe_audio.py <audio_file> [model_size]"}))
+    args = [a for a in sys.argv[1:] if a not in ("--daemon", "--batch")]
+
+    if "--daemon" in sys.argv[1:]:
+        # Keep the model loaded across files
+        serve(args[0] if args else "base")
+        sys.exit(0)
+
+    if "--batch" in sys.argv[1:]:
+        if len(args) < 2:
+            print(json.dumps({"error": "Usage: transcribe_audio.py --batch <model_size> <audio_file>..."}))
+            sys.exit(1)
+        batch(args[0], args[1:])
+        sys.exit(0)
+
+    if len(args) < 1:
+        print(json.dumps({"error": "Usage: transcribe_audio.py <audio_file> [model_size] | --daemon [model_size] | --batch <model_size> <audio_file>..."}))
         sys.exit(1)
     
-    audio_file = sys.argv[1]
-    model_size = sys.argv[2] if len(sys.argv) > 2 else "base"
+    audio_file = args[0]
+    model_size = args[1] if len(args) > 1 else "base"
     
     try:
         result = transcribe(audio_file, model_size)